@@ -1,102 +1,183 @@
 # ai.py
-import pygame
-import math
+import random
+import time
 from game_logic import apply_move, get_possible_moves, is_terminal, evaluate
 
+# Window bounds reused at every search entry instead of re-reading math.inf
+NEG_INF = float('-inf')
+POS_INF = float('inf')
+
+# Raised inside the search when the iterative-deepening deadline passes
+class SearchTimeout(Exception):
+    pass
+
+# Zobrist hashing: each (edge, owner) pair gets a random 64-bit key and a
+# position hashes to the XOR of the keys of its owned edges. Unowned edges
+# contribute nothing, so drawing an edge only XORs one key in.
+_zobrist_random = random.Random(0x5EED)
+_ZOBRIST = {}
+
+def _zobrist_key(edge, owner):
+    key = _ZOBRIST.get((edge, owner))
+    if key is None:
+        key = _zobrist_random.getrandbits(64)
+        _ZOBRIST[(edge, owner)] = key
+    return key
+
 # Helper function to create a unique hash for the game state
 def hash_state(state):
-    edge_tuples = tuple(sorted((edge, owner) for edge, owner in state['edges'].items()))
-    return hash(edge_tuples)
+    state_hash = 0
+    for edge, owner in state['edges'].items():
+        if owner != -1:
+            state_hash ^= _zobrist_key(edge, owner)
+    return state_hash
+
+# Bounded cache of evaluated positions keyed by Zobrist hash
+
+class TranspositionTable:
+    """Dict-like position cache with a fixed entry budget.
+
+    When full, the oldest half of the entries is dropped; dicts preserve
+    insertion order, so this discards the positions least likely to be
+    probed again while keeping memory bounded across long games.
+    """
+    def __init__(self, max_entries=1 << 20):
+        self.max_entries = max_entries
+        self.entries = {}
+
+    def get(self, key, default=None):
+        return self.entries.get(key, default)
+
+    def __setitem__(self, key, value):
+        if key not in self.entries and len(self.entries) >= self.max_entries:
+            for old_key in list(self.entries)[:self.max_entries // 2]:
+                del self.entries[old_key]
+        self.entries[key] = value
+
+    def __len__(self):
+        return len(self.entries)
 
 # Order moves to improve alpha-beta pruning
 
 def order_moves(state, moves, maximizing_player):
+    # Completing a cell scores a point and grants an extra turn to
+    # whichever player draws the edge, so the ordering is the same for
+    # both sides: completions first, moves that leave a cell one edge
+    # from completion (a free box for the opponent) last.
+    cells = state['cells']
+    edge_cells = state['edge_cells']
+
+    # Per-cell drawn-edge counts are kept up to date by apply_move; only
+    # states that predate init_state's counters need the full re-count
+    counts = state.get('cell_edge_count')
+    if counts is None:
+        edges = state['edges']
+        cell_edges = state['cell_edges']
+        counts = {cell: sum(1 for edge in cell_edges[cell] if edges[edge] != -1)
+                  for cell in cells}
+
     move_scores = []
     for move in moves:
         score = 0
-        for cell in state['edge_cells'][move]:
-            if state['cells'][cell] == -1:
-                edges_drawn = sum(1 for edge in state['cell_edges'][cell] if edge == move or state['edges'][edge] != -1)
+        for cell in edge_cells[move]:
+            if cells[cell] == -1:
+                edges_drawn = counts[cell] + 1
                 if edges_drawn == 6:
                     score += 100
                 elif edges_drawn == 5:
-                    score += 50
+                    score -= 50
         move_scores.append((move, score))
 
-    reverse = maximizing_player
-    return [m for m, _ in sorted(move_scores, key=lambda x: x[1], reverse=reverse)]
+    move_scores.sort(key=lambda x: x[1], reverse=True)
+    return [m for m, _ in move_scores]
 
 # Minimax with alpha-beta pruning and transposition table
 
-def minimax(state, depth, alpha, beta, maximizingPlayer, transposition_table=None):
+def minimax(state, depth, alpha, beta, maximizingPlayer, transposition_table=None, deadline=None, state_hash=None):
     if transposition_table is None:
-        transposition_table = {}
+        transposition_table = TranspositionTable()
+
+    if deadline is not None and time.perf_counter() > deadline:
+        raise SearchTimeout
 
-    state_hash = hash_state(state)
-    if state_hash in transposition_table and transposition_table[state_hash]['depth'] >= depth:
-        cached = transposition_table[state_hash]
-        return cached['value'], cached['move']
+    # The caller passes the child hash down (one XOR per move); only the
+    # root of a search has to fold the whole board
+    if state_hash is None:
+        state_hash = hash_state(state)
+    # Entries are plain (value, move, depth) tuples; at a million cached
+    # positions the per-entry dict overhead would dominate the table
+    cached = transposition_table.get(state_hash)
+    if cached is not None and cached[2] >= depth:
+        return cached[0], cached[1]
 
     if depth == 0 or is_terminal(state):
         value = evaluate(state)
-        transposition_table[state_hash] = {'value': value, 'move': None, 'depth': depth}
+        transposition_table[state_hash] = (value, None, depth)
         return value, None
 
     possible_moves = get_possible_moves(state)
     ordered_moves = order_moves(state, possible_moves, maximizingPlayer)
 
+    # Try the previous (shallower) iteration's best move first so the
+    # alpha-beta window tightens as early as possible
+    if cached is not None and cached[1] in ordered_moves:
+        ordered_moves.remove(cached[1])
+        ordered_moves.insert(0, cached[1])
+
     best_move = None
     if maximizingPlayer:
-        maxEval = -math.inf
+        maxEval = NEG_INF
         for move in ordered_moves:
             new_state, extra_turn = apply_move(state, move, 1)
-            if new_state['last_move']:
-                for cell in new_state['edge_cells'][new_state['last_move']]:
-                    if cell in new_state['claimed_items']:
-                        item = new_state['claimed_items'][cell]
-                        if item == "compass":
-                            message = "🔄 Compass of Portals activated!"
-                            message_timer = pygame.time.get_ticks()
-                        elif item == "gauntlet":
-                            message = "🧤 Shadow Gauntlet: You stole points!"
-                            message_timer = pygame.time.get_ticks()
-                        elif item == "hourglass":
-                            message = "⏳ Hourglass: Extra turn granted!"
-                            message_timer = pygame.time.get_ticks()
-
-            score, _ = minimax(new_state, depth - 1, alpha, beta, True if extra_turn else False, transposition_table)
+            score, _ = minimax(new_state, depth - 1, alpha, beta, True if extra_turn else False,
+                               transposition_table, deadline, state_hash ^ _zobrist_key(move, 1))
             if score > maxEval:
                 maxEval = score
                 best_move = move
             alpha = max(alpha, score)
             if beta <= alpha:
                 break
-        transposition_table[state_hash] = {'value': maxEval, 'move': best_move, 'depth': depth}
+        transposition_table[state_hash] = (maxEval, best_move, depth)
         return maxEval, best_move
     else:
-        minEval = math.inf
+        minEval = POS_INF
         for move in ordered_moves:
             new_state, extra_turn = apply_move(state, move, 0)
-            if new_state['last_move']:
-                for cell in new_state['edge_cells'][new_state['last_move']]:
-                    if cell in new_state['claimed_items']:
-                        item = new_state['claimed_items'][cell]
-                        if item == "compass":
-                            message = "🔄 Compass of Portals activated!"
-                            message_timer = pygame.time.get_ticks()
-                        elif item == "gauntlet":
-                            message = "🧤 Shadow Gauntlet: You stole points!"
-                            message_timer = pygame.time.get_ticks()
-                        elif item == "hourglass":
-                            message = "⏳ Hourglass: Extra turn granted!"
-                            message_timer = pygame.time.get_ticks()
-
-            score, _ = minimax(new_state, depth - 1, alpha, beta, False if extra_turn else True, transposition_table)
+            score, _ = minimax(new_state, depth - 1, alpha, beta, False if extra_turn else True,
+                               transposition_table, deadline, state_hash ^ _zobrist_key(move, 0))
             if score < minEval:
                 minEval = score
                 best_move = move
             beta = min(beta, score)
             if beta <= alpha:
                 break
-        transposition_table[state_hash] = {'value': minEval, 'move': best_move, 'depth': depth}
-        return minEval, best_move
\ No newline at end of file
+        transposition_table[state_hash] = (minEval, best_move, depth)
+        return minEval, best_move
+
+# Iterative deepening driver
+
+def find_best_move(state, max_depth, transposition_table=None, time_limit=1.0):
+    """Search with iterative deepening inside a wall-clock budget.
+
+    Runs minimax at depth 1, 2, ... max_depth, keeping the best move from
+    the deepest fully completed iteration. Each completed depth seeds the
+    transposition table, so the next depth searches its best move first
+    and prunes far more aggressively than a cold fixed-depth call.
+    """
+    if transposition_table is None:
+        transposition_table = TranspositionTable()
+
+    deadline = time.perf_counter() + time_limit
+    root_hash = hash_state(state)
+    best_move = None
+    for depth in range(1, max_depth + 1):
+        try:
+            _, move = minimax(state, depth, NEG_INF, POS_INF, True,
+                              transposition_table, deadline, root_hash)
+        except SearchTimeout:
+            break
+        if move is not None:
+            best_move = move
+        if time.perf_counter() > deadline:
+            break
+    return best_move
\ No newline at end of file
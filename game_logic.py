@@ -1,11 +1,11 @@
 # game_logic.py
 
 import math
-import copy
 import random
 import pygame  # Add this import
 
 # Constants
+DEBUG = False  # Gate the DEBUG: prints; they run inside the AI search otherwise
 TOLERANCE = 10
 TREASURES = {
     'copper': 1,
@@ -18,11 +18,12 @@ ARTIFACTS = ['hourglass', 'gauntlet', 'compass']
 
 # Game State Initialization
 
-def polygon_vertices(center, size):
-    cx, cy = center
+def corner_offsets(size):
+    # The six corner offsets of a pointy-top hexagon; every cell's
+    # vertices are this shape translated to the cell's center
     return [
-        (round(cx + size * math.cos(math.radians(60 * i - 30))),
-         round(cy + size * math.sin(math.radians(60 * i - 30))))
+        (size * math.cos(math.radians(60 * i - 30)),
+         size * math.sin(math.radians(60 * i - 30)))
         for i in range(6)
     ]
 
@@ -36,6 +37,11 @@ def init_state(board_radius, hex_size, scale):
     
     current_hex_size = hex_size * scale
 
+    # Six trig calls total: each cell's vertices are the shared corner
+    # offsets translated to its center, first to measure the board and
+    # again (shifted) once the centering offset is known
+    offsets = corner_offsets(current_hex_size)
+
     temp_vertices = {}
     valid_cells = []
     for q in range(-board_radius, board_radius + 1):
@@ -45,7 +51,7 @@ def init_state(board_radius, hex_size, scale):
                 valid_cells.append((q, r))
                 cx = current_hex_size * math.sqrt(3) * (q + r / 2)
                 cy = current_hex_size * 3 / 2 * r
-                temp_vertices[(q, r)] = polygon_vertices((cx, cy), current_hex_size)
+                temp_vertices[(q, r)] = [(cx + ox, cy + oy) for ox, oy in offsets]
 
     # Calculate board bounds
     all_x, all_y = zip(*[v for poly in temp_vertices.values() for v in poly])
@@ -89,11 +95,8 @@ def init_state(board_radius, hex_size, scale):
     }
 
     for cell in valid_cells:
-        q, r = cell
-        cx = current_hex_size * math.sqrt(3) * (q + r / 2) + offset_x
-        cy = current_hex_size * 3 / 2 * r + offset_y
-        center = (cx, cy)
-        vertices = polygon_vertices(center, current_hex_size)
+        vertices = [(round(x + offset_x), round(y + offset_y))
+                    for x, y in temp_vertices[cell]]
         state['cells'][cell] = -1
         state['cell_vertices'][cell] = vertices
 
@@ -110,6 +113,14 @@ def init_state(board_radius, hex_size, scale):
                 state['edge_cells'][edge].append(cell)
         state['cell_edges'][cell] = cell_edge_list
 
+    # Undrawn edges, maintained incrementally by apply_move so move
+    # generation never has to scan the full edge dict
+    state['open_edges'] = set(state['edges'])
+
+    # Drawn edges per cell, likewise maintained incrementally; the AI's
+    # move ordering reads these instead of re-counting each cell's edges
+    state['cell_edge_count'] = {cell: 0 for cell in valid_cells}
+
     # Assign treasures and artifacts randomly
     shuffled = valid_cells.copy()
     random.shuffle(shuffled)
@@ -127,12 +138,40 @@ def init_state(board_radius, hex_size, scale):
 
 # Move Logic
 
+# Keys whose containers apply_move may mutate; everything else (board
+# geometry and adjacency: cell_vertices, cell_edges, edge_cells) is
+# immutable after init_state and can be shared between clones
+_MUTABLE_STATE_KEYS = (
+    'cells', 'edges', 'open_edges', 'cell_edge_count', 'score',
+    'treasures', 'artifacts', 'claimed_items', 'gauntlet_available',
+    'gauntlet_timer', 'gauntlet_cell', 'last_treasure_value',
+    'compass_available', 'compass_cell', 'hourglass_bonus',
+)
+
+def clone_state(state):
+    """Copy a state for apply_move with structural sharing.
+
+    Only the containers apply_move can touch are copied (one level deep,
+    their values are all immutable); the geometry dicts are shared. This
+    is what makes the minimax search affordable compared to deepcopy,
+    which cloned every vertex list at every node.
+    """
+    new_state = dict(state)
+    for key in _MUTABLE_STATE_KEYS:
+        value = state.get(key)
+        if value is not None:
+            new_state[key] = value.copy()
+    return new_state
+
 def get_possible_moves(state):
+    open_edges = state.get('open_edges')
+    if open_edges is not None:
+        return list(open_edges)
     return [edge for edge, owner in state['edges'].items() if owner == -1]
 
 def apply_move(state, move, player):
     """Apply a move and manage artifacts/tracking."""
-    new_state = copy.deepcopy(state)
+    new_state = clone_state(state)
     # Ensure tracking dicts exist
     new_state.setdefault('gauntlet_available', {0: False, 1: False})
     new_state.setdefault('gauntlet_timer',     {0: 0,     1: 0})
@@ -144,7 +183,7 @@ def apply_move(state, move, player):
     # Decrement gauntlet lifespan if held
     if new_state['gauntlet_available'][player] and new_state['gauntlet_timer'][player] > 0:
         new_state['gauntlet_timer'][player] -= 1
-        print(f"DEBUG: Gauntlet turns left for player {player}: {new_state['gauntlet_timer'][player]}")
+        if DEBUG: print(f"DEBUG: Gauntlet turns left for player {player}: {new_state['gauntlet_timer'][player]}")
         if new_state['gauntlet_timer'][player] == 0:
             # Remove expired gauntlet
             cell0 = new_state['gauntlet_cell'][player]
@@ -152,11 +191,18 @@ def apply_move(state, move, player):
             new_state['claimed_items'].pop(cell0, None)
             new_state['gauntlet_available'][player] = False
             new_state['gauntlet_cell'][player] = None
-            print(f"DEBUG: Gauntlet expired for player {player}")
+            if DEBUG: print(f"DEBUG: Gauntlet expired for player {player}")
 
     # Mark the edge
     new_state['edges'][move] = player
-    new_state['last_move'] = move 
+    if 'open_edges' not in new_state:
+        new_state['open_edges'] = {e for e, o in new_state['edges'].items() if o == -1}
+    new_state['open_edges'].discard(move)
+    counts = new_state.get('cell_edge_count')
+    if counts is not None:
+        for cell in new_state['edge_cells'][move]:
+            counts[cell] += 1
+    new_state['last_move'] = move
     extra_turn = False
     # Check each adjacent cell for completion
     for cell in new_state['edge_cells'][move]:
@@ -164,7 +210,7 @@ def apply_move(state, move, player):
             new_state['cells'][cell] = player
             new_state['score'][player] += 1  # <--- ADD THIS LINE to award 1 base point
             extra_turn = True
-            print(f"DEBUG: Player {player} completed cell {cell}")
+            if DEBUG: print(f"DEBUG: Player {player} completed cell {cell}")
             # Treasure logic...
             if cell in new_state.get('treasures', {}):
                 t = new_state['treasures'][cell]
@@ -172,38 +218,38 @@ def apply_move(state, move, player):
                 new_state['score'][player] += v
                 new_state['claimed_items'][cell] = t
                 new_state['last_treasure_value'][player] = v
-                print(f"DEBUG: Treasure '{t}' (value {v}) claimed at {cell}")
+                if DEBUG: print(f"DEBUG: Treasure '{t}' (value {v}) claimed at {cell}")
             # Artifact logic
             if cell in new_state.get('artifacts', {}):
                 a = new_state['artifacts'][cell]
                 new_state['claimed_items'][cell] = a
-                print(f"DEBUG: Artifact '{a}' claimed at {cell}")
+                if DEBUG: print(f"DEBUG: Artifact '{a}' claimed at {cell}")
                 if a == 'hourglass':
                     # Give original extra turn and one bonus
                     new_state['hourglass_bonus'][player] += 1
-                    print(f"DEBUG: Hourglass bonus granted for player {player}")
+                    if DEBUG: print(f"DEBUG: Hourglass bonus granted for player {player}")
                 elif a == 'gauntlet':
                     new_state['gauntlet_available'][player] = True
                     new_state['gauntlet_timer'][player] = 5
                     new_state['gauntlet_cell'][player] = cell
                     new_state['artifacts'].pop(cell, None)
-                    print(f"DEBUG: Gauntlet picked up at {cell}, lifespan=5")
+                    if DEBUG: print(f"DEBUG: Gauntlet picked up at {cell}, lifespan=5")
                 elif a == 'compass':
                     new_state['compass_available'][player] = True
                     new_state['compass_cell'][player] = cell
-                    print(f"DEBUG: Compass now available for player {player}")
+                    if DEBUG: print(f"DEBUG: Compass now available for player {player}")
 
     # AFTER checking for completions, we check if we need to spend a bonus turn.
     # We only spend a bonus if we DIDN'T already earn a standard extra turn on this move.
     if not extra_turn and new_state['hourglass_bonus'][player] > 0:
         extra_turn = True  # Grant an extra turn by cashing in the bonus.
         new_state['hourglass_bonus'][player] -= 1
-        print(f"DEBUG: Using hourglass bonus turn. Remaining bonuses: {new_state['hourglass_bonus'][player]}")
+        if DEBUG: print(f"DEBUG: Using hourglass bonus turn. Remaining bonuses: {new_state['hourglass_bonus'][player]}")
 
     # Switch turn if no extra_turn
     if not extra_turn:
         new_state['turn'] = 1 - player
-        print(f"DEBUG: Next turn: player {new_state['turn']}")
+        if DEBUG: print(f"DEBUG: Next turn: player {new_state['turn']}")
 
     return new_state, extra_turn
 
@@ -216,18 +262,18 @@ def evaluate(state):
 
 # Add helper to activate compass
 def use_compass(state, player, target_cell):
-    print(f"DEBUG: Player {player} attempts compass on {target_cell}")
+    if DEBUG: print(f"DEBUG: Player {player} attempts compass on {target_cell}")
     # need a compass and a recorded source cell
     if not state.get('compass_available', {}).get(player, False) or not state.get('compass_cell', {}).get(player):
-        print("DEBUG: Compass not available or source missing")
+        if DEBUG: print("DEBUG: Compass not available or source missing")
         return state
     source = state['compass_cell'][player]
     opponent = 1 - player
     # only swap ownership and scores, keep treasures in place
     if state['cells'].get(target_cell) != opponent:
-        print("DEBUG: Target cell not owned by opponent")
+        if DEBUG: print("DEBUG: Target cell not owned by opponent")
         return state
-    print(f"DEBUG: Swapping ownership of cell {source} and {target_cell}")
+    if DEBUG: print(f"DEBUG: Swapping ownership of cell {source} and {target_cell}")
     # swap ownership
     state['cells'][source], state['cells'][target_cell] = opponent, player
     # remove compass artifact so icon disappears
@@ -239,31 +285,31 @@ def use_compass(state, player, target_cell):
     if source in state.get('treasures', {}):
         t = state['treasures'][source]; v = TREASURES[t]
         state['score'][player] -= v; state['score'][opponent] += v
-        print(f"DEBUG: Player {player} loses {v} from source treasure")
+        if DEBUG: print(f"DEBUG: Player {player} loses {v} from source treasure")
     # deduct target treasure from opponent, add to player
     if target_cell in state.get('treasures', {}):
         t = state['treasures'][target_cell]; v = TREASURES[t]
         state['score'][opponent] -= v; state['score'][player] += v
-        print(f"DEBUG: Player {player} gains {v} from target treasure")
+        if DEBUG: print(f"DEBUG: Player {player} gains {v} from target treasure")
     # clear compass availability
     state['compass_available'][player] = False
     state['compass_cell'][player] = None
-    print(f"DEBUG: Scores after compass: {state['score']}")
+    if DEBUG: print(f"DEBUG: Scores after compass: {state['score']}")
     return state
 
 
 def use_gauntlet(state, player, amount=None):
     opponent = 1 - player
     if not state['gauntlet_available'][player]:
-        print("DEBUG: No gauntlet to use")
+        if DEBUG: print("DEBUG: No gauntlet to use")
         return state
     last_val = state['last_treasure_value'][opponent]
     if last_val <= 0:
-        print("DEBUG: Nothing to steal")
+        if DEBUG: print("DEBUG: Nothing to steal")
         return state
     steal = amount if amount is not None else last_val
     steal = min(steal, last_val, state['score'][opponent])
-    print(f"DEBUG: Stealing {steal} from player {opponent}")
+    if DEBUG: print(f"DEBUG: Stealing {steal} from player {opponent}")
     state['score'][opponent] -= steal
     state['score'][player]   += steal
     # consume and remove PNG
@@ -273,5 +319,5 @@ def use_gauntlet(state, player, amount=None):
     state['gauntlet_available'][player] = False
     state['gauntlet_timer'][player]     = 0
     state['gauntlet_cell'][player]      = None
-    print("DEBUG: Gauntlet consumed")
+    if DEBUG: print("DEBUG: Gauntlet consumed")
     return state
\ No newline at end of file
@@ -1,13 +1,14 @@
 import pygame
 import sys
 import math
-import copy
 import time
 import random
 import os
+import threading
+import numpy as np
 from pygame import gfxdraw
-from game_logic import init_state, apply_move, get_possible_moves, is_terminal, use_gauntlet, use_compass
-from ai import minimax
+from game_logic import DEBUG, init_state, apply_move, get_possible_moves, is_terminal, use_gauntlet, use_compass
+from ai import find_best_move, TranspositionTable
 
 
 # ----- Constants & Board Configuration -----
@@ -16,6 +17,7 @@ DEFAULT_WIDTH, DEFAULT_HEIGHT = 800, 800  # Increased default size
 CURRENT_WIDTH, CURRENT_HEIGHT = DEFAULT_WIDTH, DEFAULT_HEIGHT
 TOLERANCE = 10                   # Pixel tolerance for clicking on an edge
 DEPTH = 3                        # Depth for the minimax search
+AI_TIME_LIMIT = 5.0              # Wall-clock budget (seconds) per AI move
 BOARD_RADIUS = 2                 # Board "radius" for hex board: cells with max(|q|,|r|,|s|)<=3
 HEX_SIZE = 60                    # Size of each hexagon
 MARGIN = 50                      # Margin from window edge to the board
@@ -56,17 +58,27 @@ UI_ANIMATION = {
     'target_screen': None,
     'current_screen': 'OPENING_SCREEN',
     'transition_active': False,
+    'transition_surface': None,  # Target screen rendered once per transition
     'button_hover_state': {},  # For button hover animations
     'hexagons': []
 }
 
 # ----- Scale Calculation Functions -----
+# The scale factor only changes on VIDEORESIZE, so it is cached in a
+# global instead of being recomputed by every caller every frame
+_SCALE_FACTOR = 1.0
+
 def get_scale_factor():
-    """Calculate the scale factor based on current window size vs default size"""
+    """Return the scale factor based on current window size vs default size"""
+    return _SCALE_FACTOR
+
+def _update_scale_factor():
+    """Recompute the cached scale factor after a window resize"""
+    global _SCALE_FACTOR
     x_scale = CURRENT_WIDTH / DEFAULT_WIDTH
     y_scale = CURRENT_HEIGHT / DEFAULT_HEIGHT
     # Use the smaller scale to ensure everything fits
-    return min(x_scale, y_scale)
+    _SCALE_FACTOR = min(x_scale, y_scale)
 
 def scale_point(point, scale_factor=None):
     """Scale a point based on the current window size"""
@@ -98,13 +110,72 @@ def axial_to_pixel(q, r, offset_x=0, offset_y=0):
     using the pointy-topped layout, and add an additional offset.
     """
     scale = get_scale_factor()
-    x = scale_hex_size() * math.sqrt(3) * (q + r/2) + offset_x * scale
-    y = scale_hex_size() * 3/2 * r + offset_y * scale
+    hex_size = scale_hex_size()
+    x = hex_size * math.sqrt(3) * (q + r/2) + offset_x * scale
+    y = hex_size * 3/2 * r + offset_y * scale
     return (x, y)
 
 
 
 # ----- Updated Drawing Function -----
+# Scaled board geometry, rebuilt only when the scale factor changes or a
+# new game state replaces the board (resize / new game)
+_SCALED_CACHE = {
+    'scale': None,
+    'source': None,       # The cell_vertices dict the cache was built from
+    'cell_verts': {},
+    'edge_pts': {},
+    'vertex_dots': [],
+    'dot_blits': [],
+    'cells': [],
+    'cell_centers': None,
+}
+
+def _blit_batch(screen, frames):
+    """Submit a list of (surface, position) pairs in one batched call"""
+    # fblits (pygame-ce) skips per-call overhead; fall back to blits elsewhere
+    blit_batch = getattr(screen, 'fblits', None)
+    if blit_batch is not None:
+        blit_batch(frames)
+    else:
+        screen.blits(frames, doreturn=False)
+
+def _scaled_geometry(state, scale):
+    """Return the cached scaled vertices/edges for state, rebuilding if stale"""
+    if _SCALED_CACHE['scale'] != scale or _SCALED_CACHE['source'] is not state['cell_vertices']:
+        cell_verts = {
+            cell: [(v[0] * scale, v[1] * scale) for v in verts]
+            for cell, verts in state['cell_vertices'].items()
+        }
+        edge_pts = {
+            edge: ((edge[0][0] * scale, edge[0][1] * scale),
+                   (edge[1][0] * scale, edge[1][1] * scale))
+            for edge in state['edges']
+        }
+        # Unique scaled vertices for the dot pass
+        vertex_dots = list({pt for verts in cell_verts.values() for pt in verts})
+
+        # Cell centres as one array for vectorized hit-testing
+        cells = list(cell_verts)
+        cell_centers = np.array(
+            [[sum(v[0] for v in cell_verts[c]) / 6.0,
+              sum(v[1] for v in cell_verts[c]) / 6.0] for c in cells],
+            dtype=np.float32)
+
+        # Pre-render one dot sprite and position it over every vertex so
+        # the dots go out as a single batched blit instead of N circle calls
+        dot_radius = max(1, int(4 * scale))
+        dot_surf = pygame.Surface((dot_radius * 2 + 1, dot_radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(dot_surf, BLACK, (dot_radius, dot_radius), dot_radius)
+        dot_surf = dot_surf.convert_alpha()
+        dot_blits = [(dot_surf, (x - dot_radius, y - dot_radius)) for x, y in vertex_dots]
+
+        _SCALED_CACHE.update(scale=scale, source=state['cell_vertices'],
+                             cell_verts=cell_verts, edge_pts=edge_pts,
+                             vertex_dots=vertex_dots, dot_blits=dot_blits,
+                             cells=cells, cell_centers=cell_centers)
+    return _SCALED_CACHE
+
 def draw_board(screen, state, font, back_button=None, logo_tagline=None, artifact_hint="", artifact_hint_timer=0):
     """
     Render the board with simplified display - only show AI thinking time.
@@ -112,7 +183,17 @@ def draw_board(screen, state, font, back_button=None, logo_tagline=None, artifac
     screen.fill(WHITE)
     scale = get_scale_factor()
     scaled_margin = MARGIN * scale
-    
+
+    # Hoist loop invariants: line widths, dot radius and the per-point
+    # scaling are computed once instead of per edge/vertex
+    last_move_width = int(6 * scale)
+    owned_width = int(4 * scale)
+    open_width = max(1, int(1 * scale))
+    last_move = state.get('last_move')
+    geometry = _scaled_geometry(state, scale)
+    cell_verts = geometry['cell_verts']
+    edge_pts = geometry['edge_pts']
+
     # Draw logo tagline at top center if available
     if logo_tagline:
         logo_rect = logo_tagline.get_rect(center=(CURRENT_WIDTH // 2, 30 * scale))
@@ -121,7 +202,7 @@ def draw_board(screen, state, font, back_button=None, logo_tagline=None, artifac
     # Fill claimed cells
     for cell, owner in state['cells'].items():
         if owner != -1:
-            vertices = [scale_point(v) for v in state['cell_vertices'][cell]]
+            vertices = cell_verts[cell]
             color = BLUE if owner == 0 else RED
             pygame.draw.polygon(screen, color, vertices)
 
@@ -136,42 +217,54 @@ def draw_board(screen, state, font, back_button=None, logo_tagline=None, artifac
                     rect = icon.get_rect(center=(cx, cy))
                     screen.blit(icon, rect)
     
-    # Draw edges - simplified without visualization highlights
-    for edge, owner in state['edges'].items():
-        # Scale the edge endpoints
-        a, b = edge
-        scaled_a = scale_point(a)
-        scaled_b = scale_point(b)
-        
-        # Check if this is the last move
-        is_last_move = (edge == state.get('last_move'))
-        
-        if owner != -1:
-            # If this is the last move, highlight it in yellow
-            if is_last_move:
-                color = YELLOW
-                width = int(6 * scale)  # Make it slightly wider for emphasis
+    # Lock once around the edge/vertex loops so each draw call doesn't
+    # pay its own implicit lock/unlock on the screen surface
+    screen.lock()
+    try:
+        # Draw edges - simplified without visualization highlights
+        # First pass: bucket the scaled segments by (color, width) so the
+        # draw pass below is a tight loop with no per-edge branching.
+        # pygame has no disjoint-segment batch call (draw.lines would
+        # connect consecutive segments), so bucketing is the usable batch.
+        edge_buckets = {}
+        width_limit = CURRENT_WIDTH
+        height_limit = CURRENT_HEIGHT
+        for edge, owner in state['edges'].items():
+            segment = edge_pts[edge]
+            (ax, ay), (bx, by) = segment
+
+            # Cheap bounding-box reject: skip edges entirely off-screen
+            # (possible when the window shrinks below the board bounds)
+            if ((ax < 0 and bx < 0) or (ay < 0 and by < 0)
+                    or (ax > width_limit and bx > width_limit)
+                    or (ay > height_limit and by > height_limit)):
+                continue
+
+            if owner != -1:
+                # If this is the last move, highlight it in yellow
+                if edge == last_move:
+                    key = (YELLOW, last_move_width)  # Slightly wider for emphasis
+                else:
+                    key = (BLUE, owned_width) if owner == 0 else (RED, owned_width)
             else:
-                color = BLUE if owner == 0 else RED
-                width = int(4 * scale)
-        else:
-            color = GRAY
-            width = max(1, int(1 * scale))
-        
-        pygame.draw.line(screen, color, scaled_a, scaled_b, width)
-    
-    # Draw vertices
-    drawn_vertices = set()
-    for vertices in state['cell_vertices'].values():
-        for vertex in vertices:
-            scaled_vertex = scale_point(vertex)
-            if scaled_vertex not in drawn_vertices:
-                pygame.draw.circle(screen, BLACK, scaled_vertex, int(4 * scale))
-                drawn_vertices.add(scaled_vertex)
+                key = (GRAY, open_width)
+            edge_buckets.setdefault(key, []).append(segment)
+
+        draw_line = pygame.draw.line
+        for (color, width), segments in edge_buckets.items():
+            for scaled_a, scaled_b in segments:
+                draw_line(screen, color, scaled_a, scaled_b, width)
+    finally:
+        screen.unlock()
+
+    # Draw vertices as one batched blit of the cached dot sprite
+    # (after unlock: surfaces can't be blitted to while locked)
+    _blit_batch(screen, geometry['dot_blits'])
     
     # Draw score text at the bottom - Human on left, AI on right
-    human_score_text = font.render(f"Human: {state['score'][0]}", True, BLUE)
-    ai_score_text = font.render(f"AI: {state['score'][1]}", True, RED)
+    # (cached: re-rendered only when the score strings actually change)
+    human_score_text = render_text_with_shadow(f"Human: {state['score'][0]}", font, BLUE)
+    ai_score_text = render_text_with_shadow(f"AI: {state['score'][1]}", font, RED)
 
     # Place Human score at the left
     screen.blit(human_score_text, (scaled_margin, CURRENT_HEIGHT - scaled_margin))
@@ -182,7 +275,7 @@ def draw_board(screen, state, font, back_button=None, logo_tagline=None, artifac
     
     # Only show AI thinking time (top right corner)
     if AI_THINKING_TIME > 0:
-        time_text = font.render(f"AI Time: {AI_THINKING_TIME:.3f}s", True, RED)
+        time_text = render_text_with_shadow(f"AI Time: {AI_THINKING_TIME:.3f}s", font, RED)
         time_x = CURRENT_WIDTH - scaled_margin - time_text.get_width()
         time_y = scaled_margin + 50 * scale
         screen.blit(time_text, (time_x, time_y))
@@ -216,23 +309,49 @@ def point_line_distance(p, a, b):
 def get_clicked_edge(pos, state):
     """
     Given the mouse position, determine if it is close to an undrawn edge.
-    Returns the edge if found, otherwise None.
+    Returns the nearest such edge if found, otherwise None.
     """
     x, y = pos
     scale = get_scale_factor()
     inverse_scale = 1 / scale
-    
+
     # Convert mouse position to original coordinate system
-    original_x, original_y = x * inverse_scale, y * inverse_scale
-    
-    for edge, owner in state['edges'].items():
-        if owner == -1:
-            a, b = edge
-            if point_line_distance((original_x, original_y), a, b) < TOLERANCE:
-                return edge
+    px, py = x * inverse_scale, y * inverse_scale
+
+    open_edges = [edge for edge, owner in state['edges'].items() if owner == -1]
+    if not open_edges:
+        return None
+
+    # Point-to-segment distances for all open edges in one vectorized pass
+    pts = np.array(open_edges, dtype=np.float32)  # shape (E, 2, 2)
+    ax, ay = pts[:, 0, 0], pts[:, 0, 1]
+    bx, by = pts[:, 1, 0], pts[:, 1, 1]
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    t = ((px - ax) * dx + (py - ay) * dy) / np.where(length_sq == 0, 1, length_sq)
+    np.clip(t, 0, 1, out=t)
+    proj_x = ax + t * dx
+    proj_y = ay + t * dy
+    dist_sq = (px - proj_x) ** 2 + (py - proj_y) ** 2
+
+    nearest = int(np.argmin(dist_sq))
+    if dist_sq[nearest] < TOLERANCE ** 2:
+        return open_edges[nearest]
     return None
 
 # ----- UI Helper Functions -----
+# Font objects keyed by point size; SysFont construction is expensive
+# (font enumeration + freetype face creation) so never build twice
+_FONT_CACHE = {}
+
+def get_font(size):
+    """Return the default SysFont at the given size, cached"""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = pygame.font.SysFont(None, size)
+        _FONT_CACHE[size] = font
+    return font
+
 def create_button(text, x, y, width, height, font, id=None):
     """Create a button with the given text and position"""
     button_id = id if id else text  # Use provided ID or default to text
@@ -292,8 +411,8 @@ def draw_button(screen, button, is_hover=False):
     # Render text with shadow
     shadow_color = (20, 20, 40, 150)  # Dark blue-ish shadow
     text_with_shadow = render_text_with_shadow(
-        button['text'], 
-        pygame.font.SysFont(None, int(32 * get_scale_factor())), 
+        button['text'],
+        get_font(int(32 * get_scale_factor())),
         WHITE,
         shadow_color,
         shadow_offset
@@ -354,12 +473,12 @@ def draw_opening_screen(screen, font, button_font, settings, skip_display=False)
     draw_hexagons(screen)
     
     # Title with shadow
-    title_font = pygame.font.SysFont(None, int(70 * get_scale_factor()))
-    subtitle_font = pygame.font.SysFont(None, int(30 * get_scale_factor()))
+    title_font = get_font(int(70 * get_scale_factor()))
+    subtitle_font = get_font(int(30 * get_scale_factor()))
     
     try:
         # Load the logo image
-        logo_img = pygame.image.load('logo (without text).png')
+        logo_img = pygame.image.load('logo (without text).png').convert_alpha()
         
         # Scale the logo to a larger size
         logo_height = int(110 * get_scale_factor())  # Increased from 70 to 110
@@ -381,44 +500,29 @@ def draw_opening_screen(screen, font, button_font, settings, skip_display=False)
     screen.blit(subtitle, subtitle_rect)
     
     # Draw buttons
+    mouse_pos = pygame.mouse.get_pos()
     for idx, button in enumerate(settings['buttons']['opening']):
-        draw_button(screen, button, is_button_hovered(button, pygame.mouse.get_pos()))
+        draw_button(screen, button, is_button_hovered(button, mouse_pos))
     
     # Update the display unless we're in a transition
     if not skip_display:
         pygame.display.flip()
 
-def draw_how_to_play_screen(screen, font, settings, skip_display=False):
-    """Draw the enhanced how to play screen with scrolling"""
-    # Draw gradient background
-    gradient = create_gradient_surface(CURRENT_WIDTH, CURRENT_HEIGHT, MENU_BG_TOP, MENU_BG_BOTTOM)
-    screen.blit(gradient, (0, 0))
-    
-    # Draw animated hexagons
-    draw_hexagons(screen)
-    
-    # Initialize scroll position if not exists
-    if 'how_to_play_scroll' not in settings:
-        settings['how_to_play_scroll'] = 0
-    
-    # Get current scroll position
-    scroll_y = settings['how_to_play_scroll']
-    
-    # Calculate visible area (with room for back button)
-    visible_top = 0
-    visible_bottom = CURRENT_HEIGHT - 100 * get_scale_factor()
-    
-    # Content starting position - moved up since title will be part of scrollable content
-    base_y = 50 * get_scale_factor()  # Reduced from 110
+# Rendered how-to-play content; the text is static so it is rebuilt only
+# when the scale factor changes, and scrolling just re-blits it
+_HTP_CACHE = {'size': None, 'surface': None, 'height': 0}
+
+def _build_how_to_play_content(font):
+    """Render the full scrollable how-to-play content surface once"""
     line_height = int(30 * get_scale_factor())
     center_x = CURRENT_WIDTH // 2
-    
+
     # Create a surface to hold content
     content_surface = pygame.Surface((CURRENT_WIDTH, 2000 * get_scale_factor()), pygame.SRCALPHA)
     y_pos = 0  # Starting at 0 for the content surface
-    
+
     # Title with shadow (now part of scrollable content)
-    title_font = pygame.font.SysFont(None, int(50 * get_scale_factor()))
+    title_font = get_font(int(50 * get_scale_factor()))
     title = render_text_with_shadow("How to Play HexaHunt", title_font, TITLE_TEXT)
     title_rect = title.get_rect(center=(center_x, y_pos + title.get_height()//2))
     content_surface.blit(title, title_rect)
@@ -555,29 +659,98 @@ def draw_how_to_play_screen(screen, font, settings, skip_display=False):
     winner_text = render_text_with_shadow("The player with the highest score wins!", font, BODY_TEXT)
     winner_text_rect = winner_text.get_rect(center=(center_x, y_pos + end_text.get_height()//2))
     content_surface.blit(winner_text, winner_text_rect)
-    
+
     # Calculate total content height
     content_height = y_pos + line_height * 3
-    
+
+    return content_surface, content_height
+
+def draw_how_to_play_screen(screen, font, settings, skip_display=False):
+    """Draw the enhanced how to play screen with scrolling"""
+    # Draw gradient background
+    gradient = create_gradient_surface(CURRENT_WIDTH, CURRENT_HEIGHT, MENU_BG_TOP, MENU_BG_BOTTOM)
+    screen.blit(gradient, (0, 0))
+
+    # Draw animated hexagons
+    draw_hexagons(screen)
+
+    # Initialize scroll position if not exists
+    if 'how_to_play_scroll' not in settings:
+        settings['how_to_play_scroll'] = 0
+
+    # Get current scroll position
+    scroll_y = settings['how_to_play_scroll']
+
+    # Calculate visible area (with room for back button)
+    visible_bottom = CURRENT_HEIGHT - 100 * get_scale_factor()
+
+    # Content starting position
+    base_y = 50 * get_scale_factor()
+
+    # Rebuild the static content only when the window layout changed
+    if _HTP_CACHE['size'] != (CURRENT_WIDTH, get_scale_factor()):
+        content_surface, content_height = _build_how_to_play_content(font)
+        _HTP_CACHE.update(size=(CURRENT_WIDTH, get_scale_factor()),
+                          surface=content_surface, height=content_height)
+
     # Clamp scroll position
-    max_scroll = max(0, content_height - (visible_bottom - base_y))
+    max_scroll = max(0, _HTP_CACHE['height'] - (visible_bottom - base_y))
     settings['how_to_play_scroll'] = max(0, min(scroll_y, max_scroll))
-    
+
     # Draw scrollable content at the right position
-    screen.blit(content_surface, (0, base_y - settings['how_to_play_scroll']))
-    
+    screen.blit(_HTP_CACHE['surface'], (0, base_y - settings['how_to_play_scroll']))
+
     # Removed scroll indicators since mouse scroll works fine
-    
+
     # Back button (fixed position, doesn't scroll)
     back_button = settings['buttons']['how_to_play'][0]
     draw_button(screen, back_button, is_button_hovered(back_button, pygame.mouse.get_pos()))
-    
+
     # Update the display unless we're in a transition
     if not skip_display:
         pygame.display.flip()
 
+# About-screen content is static, so the strings live at module level
+# instead of being rebuilt every frame
+_ABOUT_HEADER_TEXTS = (
+    "HexaHunt: A Treasure Hunting Game using Minimax Algorithm",
+    "Case Study Project",
+    "",
+    "Polytechnic University of the Philippines",
+    "College of Computer and Information Sciences",
+    "Academic Year: 2024-2025",
+    "",
+    "Developers:",
+)
+
+_ABOUT_FOOTER_TEXTS = (
+    "",
+    "Core Technology:",
+    "AI opponent driven by the Minimax algorithm with Alpha-Beta Pruning",
+    "",
+    "Game Concept:",
+    "A variation of Dots and Boxes played on a hexagonal grid",
+)
+
+_ABOUT_DEVELOPER_NAMES = (
+    "• Frilles, Roljohn C.",
+    "• Macaraeg, Paul Angelo O.",
+    "• Manansala, Roan P.",
+    "• Manucom, Precious Grace Deborah S.",
+)
+
+# GitHub URLs for each developer
+_GITHUB_LINKS = {
+    "Frilles, Roljohn C.": "https://github.com/psychammer",
+    "Macaraeg, Paul Angelo O.": "https://github.com/PaullyMac",
+    "Manansala, Roan P.": "https://github.com/rn-mnsl",
+    "Manucom, Precious Grace Deborah S.": "https://github.com/Debb1ie"
+}
+
 def draw_about_screen(screen, font, settings, skip_display=False):
     """Draw the enhanced about screen"""
+    scale = get_scale_factor()
+
     # Draw gradient background
     gradient = create_gradient_surface(CURRENT_WIDTH, CURRENT_HEIGHT, MENU_BG_TOP, MENU_BG_BOTTOM)
     screen.blit(gradient, (0, 0))
@@ -586,69 +759,56 @@ def draw_about_screen(screen, font, settings, skip_display=False):
     draw_hexagons(screen)
     
     # Title with shadow
-    title_font = pygame.font.SysFont(None, int(50 * get_scale_factor()))
+    title_font = get_font(int(50 * scale))
     title = render_text_with_shadow("About HexaHunt", title_font, TITLE_TEXT)
-    title_rect = title.get_rect(center=(CURRENT_WIDTH//2, 60 * get_scale_factor()))
+    title_rect = title.get_rect(center=(CURRENT_WIDTH//2, 60 * scale))
     screen.blit(title, title_rect)
     
     # Add logo below title
     try:
         # Load the logo image if not already stored in settings
         if 'logo_image' not in settings:
-            logo_img = pygame.image.load('logo.png')
+            logo_img = pygame.image.load('logo.png').convert_alpha()
             # Scale logo to appropriate size (about 100px height at default scale)
-            logo_height = int(100 * get_scale_factor())
+            logo_height = int(100 * scale)
             logo_width = int(logo_img.get_width() * (logo_height / logo_img.get_height()))
             settings['logo_image'] = pygame.transform.scale(logo_img, (logo_width, logo_height))
         
         # Calculate position - center horizontally, place below title
         logo_rect = settings['logo_image'].get_rect()
         logo_rect.centerx = CURRENT_WIDTH // 2
-        logo_rect.top = title_rect.bottom + 20 * get_scale_factor()
+        logo_rect.top = title_rect.bottom + 20 * scale
         
         # Draw the logo
         screen.blit(settings['logo_image'], logo_rect)
         
         # Adjust the starting y-position for the text content
-        text_y = logo_rect.bottom + 20 * get_scale_factor()
+        text_y = logo_rect.bottom + 20 * scale
     except (pygame.error, FileNotFoundError):
         print("Could not load logo image 'logo.png'")
         # If logo can't be loaded, use original text position
-        text_y = 120 * get_scale_factor()
+        text_y = 120 * scale
     
     # About content
-    line_height = int(30 * get_scale_factor())
-    
-    texts = [
-        "HexaHunt: A Treasure Hunting Game using Minimax Algorithm",
-        "Case Study Project",
-        "",
-        "Polytechnic University of the Philippines",
-        "College of Computer and Information Sciences",
-        "Academic Year: 2024-2025",
-        "",
-        "Developers:"
-    ]
-    
-    # GitHub URLs for each developer
-    github_links = {
-        "Frilles, Roljohn C.": "https://github.com/psychammer",
-        "Macaraeg, Paul Angelo O.": "https://github.com/PaullyMac",
-        "Manansala, Roan P.": "https://github.com/rn-mnsl",
-        "Manucom, Precious Grace Deborah S.": "https://github.com/Debb1ie"
-    }
-    
+    line_height = int(30 * scale)
+
+    texts = _ABOUT_HEADER_TEXTS
+
     # Create GitHub icon if not exists
     if not hasattr(settings, 'github_icon'):
         # Create a simple "GitHub" text as a clickable element
         settings['github_icon'] = {}
-        for dev in github_links:
+        for dev in _GITHUB_LINKS:
             settings['github_icon'][dev] = render_text_with_shadow("[GitHub]", font, (0, 0, 255))  # Blue color for links
     
     # Initialize clickable areas if not exists
     if 'github_clickable' not in settings:
         settings['github_clickable'] = {}
     
+    # Collect every text surface and submit them in one batched call at
+    # the end; none of these surfaces overlap, so order doesn't matter
+    blit_list = []
+
     y_pos = text_y
     for text in texts:
         # Headers bold, normal text regular
@@ -656,22 +816,14 @@ def draw_about_screen(screen, font, settings, skip_display=False):
             text_surf = render_text_with_shadow(text, font, TITLE_TEXT)
         else:
             text_surf = render_text_with_shadow(text, font, BODY_TEXT)
-            
+
         # Center align - calculate x position so text is centered
         text_rect = text_surf.get_rect(center=(CURRENT_WIDTH // 2, y_pos + text_surf.get_height() // 2))
-        screen.blit(text_surf, text_rect.topleft)
+        blit_list.append((text_surf, text_rect.topleft))
         y_pos += line_height
-    
-    # Developer names with GitHub links
-    developer_names = [
-        "• Frilles, Roljohn C.",
-        "• Macaraeg, Paul Angelo O.",
-        "• Manansala, Roan P.",
-        "• Manucom, Precious Grace Deborah S."
-    ]
-    
+
     # Draw developer names with GitHub links
-    for dev_text in developer_names:
+    for dev_text in _ABOUT_DEVELOPER_NAMES:
         # Get the developer name without the bullet point
         dev_name = dev_text[2:]  # Remove "• " prefix
         
@@ -679,12 +831,12 @@ def draw_about_screen(screen, font, settings, skip_display=False):
         text_surf = render_text_with_shadow(dev_text, font, TITLE_TEXT)
         # Left-align to make space for GitHub link, but still centered overall
         text_rect = text_surf.get_rect(center=(CURRENT_WIDTH // 2 - 50, y_pos + text_surf.get_height() // 2))
-        screen.blit(text_surf, text_rect.topleft)
-        
+        blit_list.append((text_surf, text_rect.topleft))
+
         # Draw the GitHub link
         github_surf = settings['github_icon'][dev_name]
         github_rect = github_surf.get_rect(midleft=(text_rect.right + 15, text_rect.centery))
-        screen.blit(github_surf, github_rect.topleft)
+        blit_list.append((github_surf, github_rect.topleft))
         
         # Store the clickable area for this link
         settings['github_clickable'][dev_name] = github_rect
@@ -694,27 +846,22 @@ def draw_about_screen(screen, font, settings, skip_display=False):
     y_pos += line_height * 0.5
     
     # Continue with the rest of the about content
-    texts = [
-        "",
-        "Core Technology:",
-        "AI opponent driven by the Minimax algorithm with Alpha-Beta Pruning",
-        "",
-        "Game Concept:",
-        "A variation of Dots and Boxes played on a hexagonal grid"
-    ]
-    
+    texts = _ABOUT_FOOTER_TEXTS
+
     for text in texts:
         # Headers bold, normal text regular
         if ":" in text:
             text_surf = render_text_with_shadow(text, font, TITLE_TEXT)
         else:
             text_surf = render_text_with_shadow(text, font, BODY_TEXT)
-            
+
         # Center align - calculate x position so text is centered
         text_rect = text_surf.get_rect(center=(CURRENT_WIDTH // 2, y_pos + text_surf.get_height() // 2))
-        screen.blit(text_surf, text_rect.topleft)
+        blit_list.append((text_surf, text_rect.topleft))
         y_pos += line_height
-    
+
+    _blit_batch(screen, blit_list)
+
     # Back button
     back_button = settings['buttons']['about'][0]
     draw_button(screen, back_button, is_button_hovered(back_button, pygame.mouse.get_pos()))
@@ -725,28 +872,30 @@ def draw_about_screen(screen, font, settings, skip_display=False):
 
 def draw_settings_screen(screen, font, settings, skip_display=False):
     """Draw the enhanced settings screen"""
+    scale = get_scale_factor()
+
     # Draw gradient background
     gradient = create_gradient_surface(CURRENT_WIDTH, CURRENT_HEIGHT, MENU_BG_TOP, MENU_BG_BOTTOM)
     screen.blit(gradient, (0, 0))
-    
+
     # Draw animated hexagons
     draw_hexagons(screen)
-    
+
     # Title with shadow
-    title_font = pygame.font.SysFont(None, int(50 * get_scale_factor()))
+    title_font = get_font(int(50 * scale))
     title = render_text_with_shadow("Settings", title_font, TITLE_TEXT)
-    title_rect = title.get_rect(center=(CURRENT_WIDTH//2, 60 * get_scale_factor()))
+    title_rect = title.get_rect(center=(CURRENT_WIDTH//2, 60 * scale))
     screen.blit(title, title_rect)
-    
+
     # Settings content - fixed positioning for buttons
     text_x = CURRENT_WIDTH // 4  # Left-aligned text
-    text_y = 150 * get_scale_factor()
-    line_height = int(40 * get_scale_factor())
-    row_spacing = 15 * get_scale_factor()  # Extra spacing between setting rows
+    text_y = 150 * scale
+    line_height = int(40 * scale)
+    row_spacing = 15 * scale  # Extra spacing between setting rows
 
     # Calculate a fixed position for buttons on the right side
-    button_size = 50 * get_scale_factor()
-    button_spacing = 20 * get_scale_factor()
+    button_size = 50 * scale
+    button_spacing = 20 * scale
     buttons_x = CURRENT_WIDTH * 0.6  # Position buttons at 60% of screen width
 
     # Position the - and + buttons with consistent spacing
@@ -769,8 +918,9 @@ def draw_settings_screen(screen, font, settings, skip_display=False):
     radius_right_button['text_rect'].center = radius_right_button['rect'].center
 
     # Draw radius adjustment buttons
-    draw_button(screen, radius_left_button, is_button_hovered(radius_left_button, pygame.mouse.get_pos()))
-    draw_button(screen, radius_right_button, is_button_hovered(radius_right_button, pygame.mouse.get_pos()))
+    mouse_pos = pygame.mouse.get_pos()
+    draw_button(screen, radius_left_button, is_button_hovered(radius_left_button, mouse_pos))
+    draw_button(screen, radius_right_button, is_button_hovered(radius_right_button, mouse_pos))
 
     # AI Difficulty Setting with shadow - add extra spacing between rows
     difficulty_text = render_text_with_shadow(
@@ -789,12 +939,12 @@ def draw_settings_screen(screen, font, settings, skip_display=False):
     depth_right_button['text_rect'].center = depth_right_button['rect'].center
     
     # Draw difficulty adjustment buttons
-    draw_button(screen, depth_left_button, is_button_hovered(depth_left_button, pygame.mouse.get_pos()))
-    draw_button(screen, depth_right_button, is_button_hovered(depth_right_button, pygame.mouse.get_pos()))
-    
+    draw_button(screen, depth_left_button, is_button_hovered(depth_left_button, mouse_pos))
+    draw_button(screen, depth_right_button, is_button_hovered(depth_right_button, mouse_pos))
+
     # Back button
     back_button = settings['buttons']['settings'][0]
-    draw_button(screen, back_button, is_button_hovered(back_button, pygame.mouse.get_pos()))
+    draw_button(screen, back_button, is_button_hovered(back_button, mouse_pos))
     
     # Update the display unless we're in a transition
     if not skip_display:
@@ -812,31 +962,35 @@ def get_difficulty_text(depth):
         return "Custom"
 
 # ----- Event Handling Functions -----
+# Opening-screen dispatch tables: button text -> screen to transition to,
+# or game state to switch to directly
+_OPENING_TRANSITIONS = {
+    "How to Play": 'HOW_TO_PLAY_SCREEN',
+    "About": 'ABOUT_SCREEN',
+    "Settings": 'SETTINGS_SCREEN',
+}
+_OPENING_STATES = {
+    "Start Game": 'GAME_RUNNING',
+    "Quit": 'QUIT',
+}
+
 def handle_opening_events(event, settings):
     """Handle events on the opening screen"""
     current_state = 'OPENING_SCREEN'
-    
+
     if event.type == pygame.MOUSEBUTTONDOWN:
         pos = pygame.mouse.get_pos()
-        
+
         # Check if any button was clicked
         for button in settings['buttons']['opening']:
             if button['rect'].collidepoint(pos):
-                if button['text'] == "Start Game":
-                    current_state = 'GAME_RUNNING'
-                elif button['text'] == "How to Play":
-                    start_transition('HOW_TO_PLAY_SCREEN')
-                    return 'TRANSITION'
-                elif button['text'] == "About":
-                    start_transition('ABOUT_SCREEN')
+                target_screen = _OPENING_TRANSITIONS.get(button['text'])
+                if target_screen is not None:
+                    start_transition(target_screen)
                     return 'TRANSITION'
-                elif button['text'] == "Settings":
-                    start_transition('SETTINGS_SCREEN')
-                    return 'TRANSITION'
-                elif button['text'] == "Quit":
-                    current_state = 'QUIT'
+                current_state = _OPENING_STATES.get(button['text'], current_state)
                 break
-                
+
     return current_state
 
 def handle_how_to_play_events(event, settings):
@@ -853,12 +1007,13 @@ def handle_how_to_play_events(event, settings):
             return 'TRANSITION'
         
         # Handle mouse wheel scrolling
+        scroll_step = 30 * get_scale_factor()
         if event.button == 4:  # Scroll up
             if 'how_to_play_scroll' in settings:
-                settings['how_to_play_scroll'] = max(0, settings['how_to_play_scroll'] - 30 * get_scale_factor())
+                settings['how_to_play_scroll'] = max(0, settings['how_to_play_scroll'] - scroll_step)
         elif event.button == 5:  # Scroll down
             if 'how_to_play_scroll' in settings:
-                settings['how_to_play_scroll'] += 30 * get_scale_factor()
+                settings['how_to_play_scroll'] += scroll_step
                 # Clamping happens in the draw function
                 
     # Also handle mouse wheel events separately (some systems use this event)
@@ -883,19 +1038,12 @@ def handle_about_events(event, settings):
             return 'TRANSITION'
         
         # Check if any GitHub link was clicked
-        github_links = {
-            "Frilles, Roljohn C.": "https://github.com/psychammer",
-            "Macaraeg, Paul Angelo O.": "https://github.com/PaullyMac",
-            "Manansala, Roan P.": "https://github.com/rn-mnsl",
-            "Manucom, Precious Grace Deborah S.": "https://github.com/Debb1ie"
-        }
-        
         if 'github_clickable' in settings:
             for dev_name, rect in settings['github_clickable'].items():
                 if rect.collidepoint(pos):
                     # Open the GitHub URL in the default web browser
                     import webbrowser
-                    webbrowser.open(github_links[dev_name])
+                    webbrowser.open(_GITHUB_LINKS[dev_name])
                     break
                 
     return current_state
@@ -958,39 +1106,33 @@ def run_game_loop(screen, font, settings):
     selecting_compass = False
     
     # ------- TESTING OVERRIDES -------
-    # Allow manual placement of Hourglass and treasure for testing
-    settings['test_hourglass_cell'] = (0, 1)       # place a hourglass at cell coordinates (3,4)
-    settings['test_treasure_cell'] = (5, 6)       # place a treasure at cell (5,6)
-    settings['test_treasure_type'] = 'gold'       # optional: specify treasure type (default 'gold')
-    # Any cell choose must be valid keys in state['cell_edges']
-    if settings.get('test_hourglass_cell') is not None:
-        cell = settings['test_hourglass_cell']
-        state['artifacts'][cell] = 'gauntlet'
-        print(f"DEBUG: Test Hourglass placed at {cell}")
-    if settings.get('test_treasure_cell') is not None:
-        cell_t = settings['test_treasure_cell']
-        state['treasures'][cell_t] = settings.get('test_treasure_type', 'gold')
-        print(f"DEBUG: Test treasure placed at {cell_t}")
+    # Manual placement of an artifact and treasure, opt-in via environment
+    # variable so normal games don't get their boards silently edited
+    if os.environ.get('HEXAHUNT_TEST'):
+        settings['test_hourglass_cell'] = (0, 1)       # place a hourglass at cell coordinates (3,4)
+        settings['test_treasure_cell'] = (5, 6)       # place a treasure at cell (5,6)
+        settings['test_treasure_type'] = 'gold'       # optional: specify treasure type (default 'gold')
+        # Any cell choose must be valid keys in state['cell_edges']
+        if settings.get('test_hourglass_cell') is not None:
+            cell = settings['test_hourglass_cell']
+            state['artifacts'][cell] = 'gauntlet'
+            if DEBUG: print(f"DEBUG: Test Hourglass placed at {cell}")
+        if settings.get('test_treasure_cell') is not None:
+            cell_t = settings['test_treasure_cell']
+            state['treasures'][cell_t] = settings.get('test_treasure_type', 'gold')
+            if DEBUG: print(f"DEBUG: Test treasure placed at {cell_t}")
     message = ""
     message_timer = 0
     running = True
 
-    # Load logo tagline image
-    try:
-        logo_tagline = pygame.image.load(os.path.join('assets', 'logo_tagline.png'))
-        # Scale logo appropriately
-        logo_height = int(60 * get_scale_factor())
-        logo_width = int(logo_tagline.get_width() * (logo_height / logo_tagline.get_height()))
-        logo_tagline = pygame.transform.scale(logo_tagline, (logo_width, logo_height))
-    except pygame.error as e:
-        print(f"Could not load logo tagline image: {e}")
-        logo_tagline = None
+    # Logo tagline image (decoded once, cached per scaled height)
+    logo_tagline = get_logo_tagline(int(60 * get_scale_factor()))
 
     # Create a transposition table that persists between moves
-    transposition_table = {}
+    transposition_table = TranspositionTable()
     
     # Create back button for game screen - remove stats button
-    button_font = pygame.font.SysFont(None, int(32 * get_scale_factor()))
+    button_font = get_font(int(32 * get_scale_factor()))
     back_button = create_button("Back", 20 * get_scale_factor(), 20 * get_scale_factor(), 
                               100 * get_scale_factor(), 40 * get_scale_factor(), button_font)
     
@@ -999,9 +1141,22 @@ def run_game_loop(screen, font, settings):
     animation_frame = 0
     last_animation_update = pygame.time.get_ticks()
     ai_is_thinking = False
-    
+
+    # Redraw only when something visible changed; starts dirty so the
+    # first frame always renders. The mouse is polled (MOUSEMOTION is
+    # blocked), so cursor movement is tracked here to keep the Back
+    # button's hover feedback animating on otherwise clean frames.
+    board_dirty = True
+    last_overlay_active = False
+    last_mouse_pos = pygame.mouse.get_pos()
+
     while running:
         current_time = pygame.time.get_ticks()
+
+        mouse_pos = pygame.mouse.get_pos()
+        if mouse_pos != last_mouse_pos:
+            last_mouse_pos = mouse_pos
+            board_dirty = True
         
         # Update animation frame every 0.7 seconds
         if animation_images and current_time - last_animation_update > 700:
@@ -1017,41 +1172,48 @@ def run_game_loop(screen, font, settings):
                 # Update current window size
                 CURRENT_WIDTH, CURRENT_HEIGHT = event.size
                 screen = pygame.display.set_mode((CURRENT_WIDTH, CURRENT_HEIGHT), pygame.RESIZABLE)
-                
+                _update_scale_factor()
+                scale = get_scale_factor()
+
+                # Cached gradients and text are sized to the old window
+                _GRADIENT_CACHE.clear()
+                _TEXT_CACHE.clear()
+
                 # Recalculate font size based on new window size
-                font_size = int(28 * get_scale_factor())
-                font = pygame.font.SysFont(None, max(12, font_size))
-                
+                font_size = int(28 * scale)
+                font = get_font(max(12, font_size))
+
                 # Update button positions and sizes - remove stats button updates
-                button_font = pygame.font.SysFont(None, int(32 * get_scale_factor()))
-                back_button = create_button("Back", 20 * get_scale_factor(), 20 * get_scale_factor(), 
-                                          100 * get_scale_factor(), 40 * get_scale_factor(), button_font)
-                
-                # Update logo tagline size
+                button_font = get_font(int(32 * scale))
+                back_button = create_button("Back", 20 * scale, 20 * scale,
+                                          100 * scale, 40 * scale, button_font)
+
+                # Update logo tagline size (rescaled from the cached original,
+                # not from the already-scaled copy)
                 if logo_tagline:
-                    logo_height = int(60 * get_scale_factor())
-                    logo_width = int(logo_tagline.get_width() * (logo_height / logo_tagline.get_height()))
-                    logo_tagline = pygame.transform.scale(logo_tagline, (logo_width, logo_height))
+                    logo_tagline = get_logo_tagline(int(60 * scale))
                 
-                # Save current game progress before rebuilding
-                old_edges = state['edges'].copy()
-                old_cells = state['cells'].copy()
-                old_score = state['score'].copy()
+                # Save current game progress before rebuilding. Plain
+                # references suffice: the old state dict is discarded as
+                # soon as init_state returns the rebuilt one, so nothing
+                # else can mutate these containers out from under us.
+                old_edges = state['edges']
+                old_cells = state['cells']
+                old_score = state['score']
                 old_turn = state['turn']
                 old_last_move = state['last_move']
-                old_treasures = state.get('treasures', {}).copy()
-                old_artifacts = state.get('artifacts', {}).copy()
-                old_claimed_items = state.get('claimed_items', {}).copy()
-                old_gauntlet_available = state.get('gauntlet_available', {0: False, 1: False}).copy()
-                old_compass_available = state.get('compass_available', {0: False, 1: False}).copy()
-                old_gauntlet_timer = state.get('gauntlet_timer', {0: 0, 1: 0}).copy()
-                old_gauntlet_cell = state.get('gauntlet_cell', {0: None, 1: None}).copy()
-                old_compass_cell = state.get('compass_cell', {0: None, 1: None}).copy()
-                old_last_treasure_value = state.get('last_treasure_value', {0: 0, 1: 0}).copy()
-                old_cell_edges = state['cell_edges'].copy()
+                old_treasures = state.get('treasures', {})
+                old_artifacts = state.get('artifacts', {})
+                old_claimed_items = state.get('claimed_items', {})
+                old_gauntlet_available = state.get('gauntlet_available', {0: False, 1: False})
+                old_compass_available = state.get('compass_available', {0: False, 1: False})
+                old_gauntlet_timer = state.get('gauntlet_timer', {0: 0, 1: 0})
+                old_gauntlet_cell = state.get('gauntlet_cell', {0: None, 1: None})
+                old_compass_cell = state.get('compass_cell', {0: None, 1: None})
+                old_last_treasure_value = state.get('last_treasure_value', {0: 0, 1: 0})
+                old_cell_edges = state['cell_edges']
                 
                 # Rebuild the game state to recenter the board
-                scale = get_scale_factor()
                 state = init_state(settings['board_radius'], HEX_SIZE, scale)
 
                 # Restore cell claims first
@@ -1059,20 +1221,25 @@ def run_game_loop(screen, font, settings):
                     if owner != -1 and cell in state['cells']:
                         state['cells'][cell] = owner
                 
-                # Map old edges to new edges based on their logical position
+                # Map old edges to new edges based on their logical position:
+                # cell_edges lists are built in the same vertex order before
+                # and after the rebuild, so pairing them up slot-by-slot is
+                # the whole mapping (zip stops at the shorter list)
                 edge_mapping = {}
+                new_cell_edges = state['cell_edges']
                 for cell, old_edges_list in old_cell_edges.items():
-                    if cell in state['cell_edges']:
-                        new_edges_list = state['cell_edges'][cell]
-                        for i, old_edge in enumerate(old_edges_list):
-                            if i < len(new_edges_list):
-                                edge_mapping[old_edge] = new_edges_list[i]
+                    new_edges_list = new_cell_edges.get(cell)
+                    if new_edges_list:
+                        edge_mapping.update(zip(old_edges_list, new_edges_list))
                 
                 # Restore edge ownership using mapping
                 for old_edge, owner in old_edges.items():
                     if owner != -1 and old_edge in edge_mapping:
                         new_edge = edge_mapping[old_edge]
                         state['edges'][new_edge] = owner
+                        state['open_edges'].discard(new_edge)
+                        for cell in state['edge_cells'][new_edge]:
+                            state['cell_edge_count'][cell] += 1
                 
                 # Update last_move if it exists
                 if old_last_move is not None and old_last_move in edge_mapping:
@@ -1090,7 +1257,8 @@ def run_game_loop(screen, font, settings):
                 state['gauntlet_cell'] = old_gauntlet_cell
                 state['compass_cell'] = old_compass_cell
                 state['last_treasure_value'] = old_last_treasure_value
-                
+                board_dirty = True
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 pos = pygame.mouse.get_pos()
                 
@@ -1104,6 +1272,7 @@ def run_game_loop(screen, font, settings):
                     if move is not None:
                         new_state, extra_turn = apply_move(state, move, 0)
                         state = new_state
+                        board_dirty = True
 
                         # Handle item messages and artifact hints for human player
                         if new_state['last_move']:
@@ -1112,38 +1281,39 @@ def run_game_loop(screen, font, settings):
                                     item = new_state['claimed_items'][cell]
                                     if item == "compass":
                                         message = "🔄 Compass of Portals activated!"
-                                        message_timer = pygame.time.get_ticks()
+                                        message_timer = current_time
                                         # Add artifact hint for human player
                                         artifact_hint = "Press the 'C' key. Click on any opponent-owned hexagon"
-                                        artifact_hint_timer = pygame.time.get_ticks()
+                                        artifact_hint_timer = current_time
                                     elif item == "gauntlet":
                                         message = "🧤 Shadow Gauntlet: You stole points!"
-                                        message_timer = pygame.time.get_ticks()
+                                        message_timer = current_time
                                         # Add artifact hint for human player
                                         artifact_hint = "Press the 'G' key to activate the gauntlet"
-                                        artifact_hint_timer = pygame.time.get_ticks()
+                                        artifact_hint_timer = current_time
                                     elif item == "hourglass":
                                         message = "⏳ Hourglass: extra turn granted!"
-                                        message_timer = pygame.time.get_ticks()
+                                        message_timer = current_time
                                         # Add artifact hint for human player
                                         artifact_hint = "You get a bonus turn credit"
-                                        artifact_hint_timer = pygame.time.get_ticks()
+                                        artifact_hint_timer = current_time
                         draw_board(screen, state, font, back_button, logo_tagline, artifact_hint, artifact_hint_timer)
 
             if event.type == pygame.KEYDOWN and event.key == pygame.K_g:
-                print("DEBUG: 'G' key pressed - attempting gauntlet use")
+                if DEBUG: print("DEBUG: 'G' key pressed - attempting gauntlet use")
                 if state['gauntlet_available'][0]:
                     state = use_gauntlet(state, 0)
+                    board_dirty = True
                     message = "🧤 Shadow Gauntlet used!"
-                    message_timer = pygame.time.get_ticks()
-                    print(f"DEBUG: Message set: {message}")
+                    message_timer = current_time
+                    if DEBUG: print(f"DEBUG: Message set: {message}")
                     draw_board(screen, state, font, back_button, logo_tagline, artifact_hint, artifact_hint_timer)
                     continue
             # Activate compass on 'C' key
             if event.type == pygame.KEYDOWN and event.key == pygame.K_c:
-                if state.get('compass_available', {}).get(0, False):
+                if state['compass_available'][0]:
                     selecting_compass = True
-                    print("DEBUG: Compass activation mode. Click an opponent cell to swap.")
+                    if DEBUG: print("DEBUG: Compass activation mode. Click an opponent cell to swap.")
                     continue
 
             # If in compass selection mode, capture cell click
@@ -1151,8 +1321,9 @@ def run_game_loop(screen, font, settings):
                 cell = get_clicked_cell(pos, state)  # implement this helper
                 if cell is not None:
                     state = use_compass(state, 0, cell)
+                    board_dirty = True
                     message = "🔄 Compass used! Ownership swapped."  # Fixed the character
-                    message_timer = pygame.time.get_ticks()
+                    message_timer = current_time
                 selecting_compass = False
                 draw_board(screen, state, font, back_button, logo_tagline, artifact_hint, artifact_hint_timer)
                 continue
@@ -1163,12 +1334,24 @@ def run_game_loop(screen, font, settings):
             ai_is_thinking = True
             pygame.display.set_caption("AI is thinking...")
             
-            # Draw board and animation while AI is thinking
+            # Draw board and animation while AI is thinking. The board is
+            # static for the whole search, so remember the strip of it under
+            # the animation: later frames restore that patch, redraw the
+            # sprite and present just that band with display.update instead
+            # of flipping the full window.
             draw_board(screen, state, font, back_button, logo_tagline, artifact_hint, artifact_hint_timer)
+            anim_band = None
+            anim_patch = None
             if animation_images:
+                scale = get_scale_factor()
+                max_frame_height = max(img.get_height() for img in animation_images)
+                band_height = int((max_frame_height * 0.3 + 80) * scale) + 2
+                anim_band = pygame.Rect(0, CURRENT_HEIGHT - band_height,
+                                        CURRENT_WIDTH, band_height).clip(screen.get_rect())
+                anim_patch = screen.subsurface(anim_band).copy()
                 draw_ai_thinking_animation(screen, animation_images[animation_frame], font)
             pygame.display.flip()
-            
+
             # Double-check that there are valid moves available
             possible_moves = get_possible_moves(state)
             if not possible_moves:
@@ -1178,45 +1361,66 @@ def run_game_loop(screen, font, settings):
                 continue
             
             # Record start time for AI thinking
-            start_time = time.time()
-            
-            # Get list of valid moves before calling minimax
-            valid_moves = get_possible_moves(state)
+            start_time = time.perf_counter()
 
             # AI makes its move only if there are valid moves
-            if valid_moves:
-                _, move = minimax(state, DEPTH, -math.inf, math.inf, True, transposition_table)
-                
-                # Extra validation
-                if move is None or move not in state['edges'] or state['edges'][move] != -1:
+            if possible_moves:
+                # Run the search on a worker thread so the UI keeps
+                # pumping events and animating while the AI thinks
+                search_result = {}
+
+                def _search():
+                    search_result['move'] = find_best_move(
+                        state, DEPTH, transposition_table, time_limit=AI_TIME_LIMIT)
+
+                search_thread = threading.Thread(target=_search, daemon=True)
+                search_thread.start()
+
+                while search_thread.is_alive():
+                    # Pop only QUIT so resizes and clicks arriving during
+                    # the search stay queued for the main handler below
+                    for event in pygame.event.get(pygame.QUIT):
+                        pygame.quit()
+                        sys.exit()
+                    current_time = pygame.time.get_ticks()
+                    if anim_band is not None and current_time - last_animation_update > 700:
+                        animation_frame = (animation_frame + 1) % len(animation_images)
+                        last_animation_update = current_time
+                        screen.blit(anim_patch, anim_band)
+                        draw_ai_thinking_animation(screen, animation_images[animation_frame], font)
+                        pygame.display.update(anim_band)
+                    clock.tick(30)
+
+                search_thread.join()
+                move = search_result.get('move')
+
+                # The search may have run for seconds; resample the clock
+                # once so message timers start from now, not frame start
+                current_time = pygame.time.get_ticks()
+
+                # Fall back to a random open edge if the search returned
+                # nothing usable; possible_moves is the open-edge list
+                # computed above, so no rescan of the board is needed
+                if move is None or state['edges'].get(move) != -1:
                     print(f"AI attempted invalid move: {move}")
-                    valid_moves = []
-                    for edge, owner in state['edges'].items():
-                        if owner == -1:
-                            valid_moves.append(edge)
-                            
-                    if valid_moves:
-                        move = random.choice(valid_moves)
-                        print(f"Selected random valid move instead: {move}")
-                    else:
-                        continue
-                
-                # One final verification before applying the move
-                if state['edges'][move] != -1:
-                    print(f"CRITICAL: Move {move} already played! Owner: {state['edges'][move]}")
-                    continue
-                    
+                    move = random.choice(possible_moves)
+                    print(f"Selected random valid move instead: {move}")
+
+
                 # Calculate and store thinking time
-                AI_THINKING_TIME = time.time() - start_time
+                AI_THINKING_TIME = time.perf_counter() - start_time
                 
                 # Apply the AI's move
                 new_state, extra_turn = apply_move(state, move, 1)
                 state = new_state
+                board_dirty = True
 
                 # If AI just picked up a gauntlet, use it right away
-                if state.get('gauntlet_available', {}).get(1, False) \
-                and state.get('last_treasure_value', {}).get(0, 0) > 0:
-                    print("DEBUG: AI uses gauntlet against a valid target")
+                # init_state/apply_move guarantee these keys, so plain
+                # subscripts replace the defensive get-chains (which also
+                # allocated a throwaway {} default on every check)
+                if state['gauntlet_available'][1] and state['last_treasure_value'][0] > 0:
+                    if DEBUG: print("DEBUG: AI uses gauntlet against a valid target")
                     state = use_gauntlet(state, 1)
 
                 # Handle item messages
@@ -1237,13 +1441,24 @@ def run_game_loop(screen, font, settings):
             pygame.display.set_caption("HexaHunt - Hexagonal Dots and Boxes")
             ai_is_thinking = False
 
-        # Draw the current game state
-        draw_board(screen, state, font, back_button, logo_tagline, artifact_hint, artifact_hint_timer)
-        # Draw animation if AI is thinking
-        if ai_is_thinking and animation_images:
-            draw_ai_thinking_animation(screen, animation_images[animation_frame], font)
-            pygame.display.flip()
-        
+        # Redraw only when something visible changed: a move was applied,
+        # the window was resized, the AI animation is running, or a timed
+        # overlay (message/hint) appeared or expired since the last frame
+        overlay_active = bool(
+            (message and current_time - message_timer < 2000)
+            or (artifact_hint and current_time - artifact_hint_timer < 5000))
+        if overlay_active != last_overlay_active:
+            board_dirty = True
+        last_overlay_active = overlay_active
+
+        if board_dirty or overlay_active or (ai_is_thinking and animation_images):
+            draw_board(screen, state, font, back_button, logo_tagline, artifact_hint, artifact_hint_timer)
+            # Draw animation if AI is thinking
+            if ai_is_thinking and animation_images:
+                draw_ai_thinking_animation(screen, animation_images[animation_frame], font)
+                pygame.display.flip()
+            board_dirty = False
+
         if is_terminal(state):
             # Final drawing and delay before returning to menu
             draw_board(screen, state, font, back_button, logo_tagline, artifact_hint, artifact_hint_timer)
@@ -1266,12 +1481,13 @@ def run_game_loop(screen, font, settings):
             screen.blit(overlay, (0, 0))
             
             # Position text below center of the window
+            text_offset_y = CURRENT_HEIGHT // 2 + 50 * get_scale_factor()
             final_text = font.render(f"Game Over! {result}", True, text_color)
-            final_rect = final_text.get_rect(center=(CURRENT_WIDTH // 2, CURRENT_HEIGHT // 2 + 50 * get_scale_factor()))
-            
+            final_rect = final_text.get_rect(center=(CURRENT_WIDTH // 2, text_offset_y))
+
             # Draw shadow for better visibility
             shadow_text = font.render(f"Game Over! {result}", True, BLACK)
-            shadow_rect = shadow_text.get_rect(center=(CURRENT_WIDTH // 2 + 2, CURRENT_HEIGHT // 2 + 50 * get_scale_factor() + 2))
+            shadow_rect = shadow_text.get_rect(center=(CURRENT_WIDTH // 2 + 2, text_offset_y + 2))
             screen.blit(shadow_text, shadow_rect)
             
             # Draw main text
@@ -1281,114 +1497,200 @@ def run_game_loop(screen, font, settings):
             pygame.time.delay(3000)
             return
         
-        if message and pygame.time.get_ticks() - message_timer < 2000:
+        if message and current_time - message_timer < 2000:
             popup_surface = font.render(message, True, (255, 255, 0))
             screen.blit(popup_surface, (CURRENT_WIDTH // 2 - popup_surface.get_width() // 2, 10))
         clock.tick(30)
         
 # ----- Hexagon Background Animation -----
-class AnimatedHexagon:
-    """Class to represent a floating background hexagon"""
-    def __init__(self, width, height):
-        # Random size between 20 and 80
-        self.size = random.randint(20, 80)
+# Base hexagon sprites shared across the pool, keyed by (size, alpha)
+_HEX_SPRITE_CACHE = {}
+
+def _hexagon_sprite(size, alpha):
+    """Rasterize a hexagon sprite once per unique (size, alpha) pair"""
+    key = (size, alpha)
+    sprite = _HEX_SPRITE_CACHE.get(key)
+    if sprite is not None:
+        return sprite
+
+    span = size * 2 + 4  # Small border so the outline isn't clipped
+    sprite = pygame.Surface((span, span), pygame.SRCALPHA)
+    center = span // 2
+    vertices = []
+    for i in range(6):
+        angle_rad = math.radians(60 * i)
+        vx = center + size * math.cos(angle_rad)
+        vy = center + size * math.sin(angle_rad)
+        vertices.append((int(vx), int(vy)))
+
+    # Draw filled hexagon with alpha
+    gfxdraw.filled_polygon(sprite, vertices,
+                          (HEX_COLOR[0], HEX_COLOR[1], HEX_COLOR[2], alpha))
+
+    # Draw outline with slightly more alpha
+    outline_alpha = min(255, alpha + 30)
+    gfxdraw.aapolygon(sprite, vertices,
+                     (HEX_COLOR[0], HEX_COLOR[1], HEX_COLOR[2], outline_alpha))
+
+    # Match the display format so blits take the fast path
+    sprite = sprite.convert_alpha()
+    _HEX_SPRITE_CACHE[key] = sprite
+    return sprite
+
+# Pre-rotated sprite rings keyed by (size, alpha); 10-degree steps are
+# close enough for slow-drifting background decoration. The pool only
+# requests quantized size/alpha buckets, so the keyspace stays small and
+# the cache never needs eviction.
+_HEX_ROTATION_STEP = 10
+_HEX_ROTATION_CACHE = {}
+
+def _hexagon_rotations(size, alpha):
+    """Return the ring of pre-rotated sprites for a (size, alpha) pair"""
+    key = (size, alpha)
+    rotations = _HEX_ROTATION_CACHE.get(key)
+    if rotations is None:
+        base = _hexagon_sprite(size, alpha)
+        rotations = [pygame.transform.rotozoom(base, -angle, 1.0).convert_alpha()
+                     for angle in range(0, 360, _HEX_ROTATION_STEP)]
+        _HEX_ROTATION_CACHE[key] = rotations
+    return rotations
+
+def initialize_hexagons(count, width, height):
+    """Create the hexagon pool as parallel arrays plus per-hexagon sprite rings"""
+    # Random size between 20 and 80, random transparency, both quantized
+    # to coarse buckets so the pool draws from at most 7 x 4 shared sprite
+    # rings — this also bounds the rotation cache across window resizes
+    sizes = [random.randrange(20, 81, 10) for _ in range(count)]
+    alphas = [random.randrange(20, 81, 20) for _ in range(count)]
+    return {
         # Random position anywhere on screen
-        self.x = random.randint(0, width)
-        self.y = random.randint(0, height)
+        'x': np.array([random.randint(0, width) for _ in range(count)], dtype=np.float32),
+        'y': np.array([random.randint(0, height) for _ in range(count)], dtype=np.float32),
         # Random slow velocity
-        self.vx = random.uniform(-0.5, 0.5)
-        self.vy = random.uniform(-0.5, 0.5)
+        'vx': np.array([random.uniform(-0.5, 0.5) for _ in range(count)], dtype=np.float32),
+        'vy': np.array([random.uniform(-0.5, 0.5) for _ in range(count)], dtype=np.float32),
         # Random rotation state and speed
-        self.angle = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-1, 1)
-        # Random transparency
-        self.alpha = random.randint(20, 80)
-        self.width = width
-        self.height = height
-
-    def update(self):
-        # Update position
-        self.x += self.vx
-        self.y += self.vy
-        # Wrap around edges
-        if self.x < -self.size:
-            self.x = self.width + self.size
-        elif self.x > self.width + self.size:
-            self.x = -self.size
-        if self.y < -self.size:
-            self.y = self.height + self.size
-        elif self.y > self.height + self.size:
-            self.y = -self.size
-        # Update rotation
-        self.angle += self.rotation_speed
-        if self.angle >= 360:
-            self.angle -= 360
-
-    def draw(self, screen):
-        # Calculate vertices based on current position and rotation
-        vertices = []
-        for i in range(6):
-            angle_deg = 60 * i + self.angle
-            angle_rad = math.radians(angle_deg)
-            vx = self.x + self.size * math.cos(angle_rad)
-            vy = self.y + self.size * math.sin(angle_rad)
-            vertices.append((int(vx), int(vy)))
-        
-        # Draw filled hexagon with alpha
-        gfxdraw.filled_polygon(screen, vertices, 
-                              (HEX_COLOR[0], HEX_COLOR[1], HEX_COLOR[2], self.alpha))
-        
-        # Draw outline with slightly more alpha
-        outline_alpha = min(255, self.alpha + 30)
-        gfxdraw.aapolygon(screen, vertices, 
-                         (HEX_COLOR[0], HEX_COLOR[1], HEX_COLOR[2], outline_alpha))
-
-def initialize_hexagons(count, width, height):
-    """Create a pool of animated hexagons"""
-    return [AnimatedHexagon(width, height) for _ in range(count)]
+        'angle': np.array([random.uniform(0, 360) for _ in range(count)], dtype=np.float32),
+        'rotation_speed': np.array([random.uniform(-1, 1) for _ in range(count)], dtype=np.float32),
+        'size': np.array(sizes, dtype=np.float32),
+        'rotations': [_hexagon_rotations(s, a) for s, a in zip(sizes, alphas)],
+        'width': width,
+        'height': height,
+    }
 
 def update_hexagons():
-    """Update all hexagons in the pool"""
-    for hexagon in UI_ANIMATION['hexagons']:
-        hexagon.update()
+    """Advance every hexagon in the pool with vectorized array ops"""
+    pool = UI_ANIMATION['hexagons']
+    if not pool:
+        return
+    x, y, size = pool['x'], pool['y'], pool['size']
+    width, height = pool['width'], pool['height']
+
+    # Update positions
+    x += pool['vx']
+    y += pool['vy']
+
+    # Wrap around edges
+    mask = x < -size
+    x[mask] = width + size[mask]
+    mask = x > width + size
+    x[mask] = -size[mask]
+    mask = y < -size
+    y[mask] = height + size[mask]
+    mask = y > height + size
+    y[mask] = -size[mask]
+
+    # Update rotation
+    angle = pool['angle']
+    angle += pool['rotation_speed']
+    np.mod(angle, 360, out=angle)
 
 def draw_hexagons(screen):
-    """Draw all hexagons from the pool"""
-    for hexagon in UI_ANIMATION['hexagons']:
-        hexagon.draw(screen)
+    """Draw all hexagons from the pool in a single batched blit call"""
+    pool = UI_ANIMATION['hexagons']
+    if not pool:
+        return
+    width, height = pool['width'], pool['height']
+    indices = (pool['angle'] // _HEX_ROTATION_STEP).astype(np.int32)
+    frames = []
+    for i, rotations in enumerate(pool['rotations']):
+        image = rotations[indices[i] % len(rotations)]
+        rect = image.get_rect(center=(pool['x'][i], pool['y'][i]))
+        # Hexagons drift past the edges before wrapping; skip the ones
+        # entirely outside the window instead of handing pygame a no-op blit
+        if rect.right < 0 or rect.left > width or rect.bottom < 0 or rect.top > height:
+            continue
+        frames.append((image, rect.topleft))
+    _blit_batch(screen, frames)
 
 # ----- Gradient Background -----
+# Built gradients keyed by (width, height, color_top, color_bottom) so the
+# draw_*_screen functions get an O(1) lookup instead of a full rebuild
+_GRADIENT_CACHE = {}
+
 def create_gradient_surface(width, height, color_top, color_bottom):
-    """Create a vertical gradient surface"""
-    surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    
-    for y in range(height):
-        # Calculate interpolation factor
-        factor = y / height
-        
-        # Interpolate between colors
-        r = int(color_top[0] * (1 - factor) + color_bottom[0] * factor)
-        g = int(color_top[1] * (1 - factor) + color_bottom[1] * factor)
-        b = int(color_top[2] * (1 - factor) + color_bottom[2] * factor)
-        
-        # Draw a horizontal line with the calculated color
-        # Fixed: Added missing end_pos parameter (width, y)
-        pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
-    
+    """Create a vertical gradient surface with a vectorized NumPy fill"""
+    key = (width, height, color_top, color_bottom)
+    cached = _GRADIENT_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # Interpolation factor for each row of the surface
+    factors = np.linspace(0.0, 1.0, height, dtype=np.float32)[:, None]
+
+    # Interpolate between colors for all rows at once
+    top = np.asarray(color_top[:3], dtype=np.float32)
+    bottom = np.asarray(color_bottom[:3], dtype=np.float32)
+    rows = (top * (1.0 - factors) + bottom * factors).astype(np.uint8)
+
+    # Broadcast the (height, 3) column across the full width and copy
+    # it into the surface in a single C-level operation
+    arr = np.broadcast_to(rows[:, None, :], (height, width, 3))
+    surface = pygame.Surface((width, height))
+    pygame.surfarray.blit_array(surface, arr.swapaxes(0, 1))
+
+    # Match the display format once so every later blit stays cheap
+    surface = surface.convert()
+    _GRADIENT_CACHE[key] = surface
     return surface
 
 # ----- Enhanced Text Rendering -----
+# Rendered text surfaces keyed by (text, font, color); static labels are
+# rasterized once instead of every frame
+_TEXT_CACHE = {}
+_TEXT_CACHE_LIMIT = 512
+
 def render_text_with_shadow(text, font, color, shadow_color=(50, 50, 50, 128), offset=2):
-    """Render text without shadow effect"""
-    # Simply return regular text without applying shadow effects
-    return font.render(text, True, color)
+    """Render text without shadow effect, cached per (text, font, color)"""
+    key = (text, id(font), color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_LIMIT:
+            _TEXT_CACHE.clear()
+        surface = font.render(text, True, color).convert_alpha()
+        _TEXT_CACHE[key] = surface
+    return surface
 
 # ----- Screen Transition System -----
+# Screen-name -> draw-function dispatch used by the main loop and the
+# transition system; one dict lookup replaces the five-way if/elif chains
+SCREEN_DRAWERS = {
+    'OPENING_SCREEN': lambda surface, settings, skip: draw_opening_screen(
+        surface, base_font, button_font, settings, skip_display=skip),
+    'HOW_TO_PLAY_SCREEN': lambda surface, settings, skip: draw_how_to_play_screen(
+        surface, base_font, settings, skip_display=skip),
+    'ABOUT_SCREEN': lambda surface, settings, skip: draw_about_screen(
+        surface, base_font, settings, skip_display=skip),
+    'SETTINGS_SCREEN': lambda surface, settings, skip: draw_settings_screen(
+        surface, base_font, settings, skip_display=skip),
+}
+
 def start_transition(target_screen):
     """Begin a screen transition to the target screen"""
     UI_ANIMATION['transition_active'] = True
     UI_ANIMATION['target_screen'] = target_screen
     UI_ANIMATION['transition_alpha'] = 0
+    UI_ANIMATION['transition_surface'] = None  # Rendered lazily on first frame
 
 def update_transition():
     """Update the screen transition effect"""
@@ -1401,6 +1703,7 @@ def update_transition():
             UI_ANIMATION['transition_alpha'] = 255
             UI_ANIMATION['transition_active'] = False
             UI_ANIMATION['current_screen'] = UI_ANIMATION['target_screen']
+            UI_ANIMATION['transition_surface'] = None  # Free the cached render
             return UI_ANIMATION['target_screen']
     
     return None
@@ -1409,35 +1712,61 @@ def draw_transition(screen, next_screen_func, settings):
     """Draw the transition effect"""
     # If we're in an active transition, draw the target screen with partial alpha
     if UI_ANIMATION['transition_active']:
-        # Create a surface for the target screen
-        target_surface = pygame.Surface((CURRENT_WIDTH, CURRENT_HEIGHT), pygame.SRCALPHA)
-        
-        # Draw the target screen to our surface
-        if UI_ANIMATION['target_screen'] == 'OPENING_SCREEN':
-            draw_opening_screen(target_surface, base_font, button_font, settings, skip_display=True)
-        elif UI_ANIMATION['target_screen'] == 'HOW_TO_PLAY_SCREEN':
-            draw_how_to_play_screen(target_surface, base_font, settings, skip_display=True)
-        elif UI_ANIMATION['target_screen'] == 'ABOUT_SCREEN':
-            draw_about_screen(target_surface, base_font, settings, skip_display=True)
-        elif UI_ANIMATION['target_screen'] == 'SETTINGS_SCREEN':
-            draw_settings_screen(target_surface, base_font, settings, skip_display=True)
-        
-        # Apply alpha to the entire surface
-        alpha_surface = pygame.Surface((CURRENT_WIDTH, CURRENT_HEIGHT), pygame.SRCALPHA)
-        alpha_surface.fill((255, 255, 255, UI_ANIMATION['transition_alpha']))
-        target_surface.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        
-        # Draw the alpha-adjusted surface to the screen
+        # Render the target screen once per transition and reuse it while fading
+        target_surface = UI_ANIMATION['transition_surface']
+        if target_surface is None:
+            # Plain (opaque) surface so set_alpha takes pygame's fast blit path
+            target_surface = pygame.Surface((CURRENT_WIDTH, CURRENT_HEIGHT))
+
+            # Draw the target screen to our surface
+            drawer = SCREEN_DRAWERS.get(UI_ANIMATION['target_screen'])
+            if drawer:
+                drawer(target_surface, settings, True)
+
+            UI_ANIMATION['transition_surface'] = target_surface
+
+        # Fade the cached render in with per-surface alpha; this is a single
+        # blended blit instead of an extra fill + BLEND_RGBA_MULT pass
+        target_surface.set_alpha(UI_ANIMATION['transition_alpha'])
         screen.blit(target_surface, (0, 0))
 
 # Add these functions after the other helper functions
+# Tagline logo, decoded from disk once and cached per scaled height
+_LOGO_TAGLINE = {'original': None, 'failed': False, 'scaled': {}}
+
+def get_logo_tagline(height):
+    """Return the tagline logo scaled to the given height, loading and caching as needed"""
+    if _LOGO_TAGLINE['failed']:
+        return None
+    if _LOGO_TAGLINE['original'] is None:
+        try:
+            _LOGO_TAGLINE['original'] = pygame.image.load(
+                os.path.join('assets', 'logo_tagline.png')).convert_alpha()
+        except pygame.error as e:
+            print(f"Could not load logo tagline image: {e}")
+            _LOGO_TAGLINE['failed'] = True
+            return None
+
+    scaled = _LOGO_TAGLINE['scaled'].get(height)
+    if scaled is None:
+        original = _LOGO_TAGLINE['original']
+        width = int(original.get_width() * (height / original.get_height()))
+        scaled = pygame.transform.scale(original, (width, height))
+        _LOGO_TAGLINE['scaled'][height] = scaled
+    return scaled
+
+# Animation frames are loaded and pre-scaled once, then reused for every game
+_ANIMATION_CACHE = {'loaded': False, 'images': None}
+
 def load_animation_images():
     """Load the animation image sequence from assets folder and pre-scale them smaller"""
+    if _ANIMATION_CACHE['loaded']:
+        return _ANIMATION_CACHE['images']
     images = []
     try:
         for i in range(1, 5):
             path = os.path.join('assets', f"{i}.png")
-            original_img = pygame.image.load(path)
+            original_img = pygame.image.load(path).convert_alpha()
             
             # Pre-scale images to be much smaller (20% of original size)
             original_width = original_img.get_width()
@@ -1448,43 +1777,57 @@ def load_animation_images():
             # Scale the image
             scaled_img = pygame.transform.scale(original_img, (new_width, new_height))
             images.append(scaled_img)
-            
+
+        _ANIMATION_CACHE.update(loaded=True, images=images)
         return images
     except pygame.error as e:
         print(f"Could not load animation images from assets folder: {e}")
+        _ANIMATION_CACHE.update(loaded=True, images=None)
         return None
 
+# Pre-scaled thinking frames and label, rebuilt only when the scale changes
+_THINKING_CACHE = {'scale': None, 'frames': {}, 'label': None}
+
 def draw_ai_thinking_animation(screen, current_frame, font):
     """Draw the AI thinking animation and text at the bottom of the screen"""
-    # Scale the image to a much smaller size (30% of original size)
-    scale = get_scale_factor() * 0.3
-    img_width = int(current_frame.get_width() * scale)
-    img_height = int(current_frame.get_height() * scale)
-    
-    # Create a scaled version of the image preserving transparency
-    scaled_img = pygame.transform.scale(current_frame, (img_width, img_height))
-    
-    # Position the image at the horizontal center and near the bottom of the screen
-    # (leaving space for text below it)
-    margin_from_bottom = 80 * get_scale_factor()  # Space from bottom of screen
+    sf = get_scale_factor()
+    cache = _THINKING_CACHE
+    if cache['scale'] != sf:
+        cache.update(scale=sf, frames={}, label=None)
+
+    # Scale the image to a much smaller size (30% of original size),
+    # cached per frame so the transform runs once per scale
+    scaled_img = cache['frames'].get(id(current_frame))
+    if scaled_img is None:
+        scale = sf * 0.3
+        scaled_img = pygame.transform.scale(
+            current_frame,
+            (int(current_frame.get_width() * scale), int(current_frame.get_height() * scale)))
+        cache['frames'][id(current_frame)] = scaled_img
+
+    # "AI is Thinking" label, likewise rendered once per scale
+    if cache['label'] is None:
+        thinking_font = get_font(int(24 * sf))
+        cache['label'] = thinking_font.render("AI is Thinking", True, RED)
+    thinking_text = cache['label']
+
+    # Position the image at the horizontal center and near the bottom of the
+    # screen, with the text just below it
+    img_width = scaled_img.get_width()
+    img_height = scaled_img.get_height()
+    margin_from_bottom = 80 * sf  # Space from bottom of screen
     img_x = (CURRENT_WIDTH - img_width) // 2
     img_y = CURRENT_HEIGHT - margin_from_bottom - img_height
-    
-    # Draw the scaled image (preserves transparency)
-    screen.blit(scaled_img, (img_x, img_y))
-    
-    # Draw "AI is Thinking" text below the image with smaller font
-    thinking_font = pygame.font.SysFont(None, int(24 * get_scale_factor()))
-    thinking_text = thinking_font.render("AI is Thinking", True, RED)
     text_x = (CURRENT_WIDTH - thinking_text.get_width()) // 2
-    text_y = CURRENT_HEIGHT - margin_from_bottom + 10 * get_scale_factor()
-    
-    screen.blit(thinking_text, (text_x, text_y))
+    text_y = CURRENT_HEIGHT - margin_from_bottom + 10 * sf
+
+    _blit_batch(screen, [(scaled_img, (img_x, img_y)),
+                         (thinking_text, (text_x, text_y))])
 
 def draw_artifact_hint(screen, hint_text, font):
     """Draw the artifact hint text at the bottom center of the screen"""
     # Use a smaller font for the hint
-    hint_font = pygame.font.SysFont(None, int(20 * get_scale_factor()))
+    hint_font = get_font(int(20 * get_scale_factor()))
     
     # Create the hint text surface with a distinctive color (purple/magenta)
     hint_surface = hint_font.render(hint_text, True, (128, 0, 128))  # Purple color
@@ -1515,11 +1858,24 @@ def draw_artifact_hint(screen, hint_text, font):
     screen.blit(hint_surface, (text_x, text_y))
 
 def get_clicked_cell(pos, state):
+    """Return the cell containing pos, or None if the click missed the board.
+
+    On a hex grid the containing cell is always the one with the nearest
+    centre, so a single vectorized argmin over the cached centres replaces
+    the per-cell ray-casting scan; one polygon test then rejects clicks
+    that land outside the board entirely.
+    """
+    geometry = _scaled_geometry(state, get_scale_factor())
+    cells = geometry['cells']
+    if not cells:
+        return None
+
     x, y = pos
-    for cell, verts in state['cell_vertices'].items():
-        poly = [scale_point(v) for v in verts]
-        if point_in_polygon((x, y), poly):
-            return cell
+    centers = geometry['cell_centers']
+    distances = (centers[:, 0] - x) ** 2 + (centers[:, 1] - y) ** 2
+    cell = cells[int(np.argmin(distances))]
+    if point_in_polygon((x, y), geometry['cell_verts'][cell]):
+        return cell
     return None
 
 # Ray-casting algorithm for point-in-polygon
@@ -1549,7 +1905,15 @@ def load_item_icons():
 def main():
     global CURRENT_WIDTH, CURRENT_HEIGHT, base_font, button_font, ITEM_ICONS
     pygame.init()
-    
+
+    # Only queue the event types the game actually handles; everything else
+    # (mouse motion, window focus chatter, ...) is dropped inside SDL instead
+    # of being built into Python Event objects every frame. Hover state keeps
+    # working because pygame.mouse.get_pos() polls SDL directly.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.VIDEORESIZE, pygame.KEYDOWN,
+                              pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL])
+
     # Set custom window icon
     try:
         icon = pygame.image.load('logo.png')
@@ -1562,8 +1926,8 @@ def main():
     pygame.display.set_caption("HexaHunt")
     
     # Initialize fonts
-    base_font = pygame.font.SysFont(None, 28)  # Base font for game
-    button_font = pygame.font.SysFont(None, 32)  # Slightly larger for buttons
+    base_font = get_font(28)  # Base font for game
+    button_font = get_font(32)  # Slightly larger for buttons
     
     # Setup settings and buttons
     settings = {
@@ -1572,51 +1936,72 @@ def main():
         'buttons': {}
     }
     
-    # Create buttons for all screens
+    # Create buttons for all screens once; later calls only reposition them
     def update_buttons():
         # Calculate button positions based on current window size
-        button_width = 200 * get_scale_factor()
-        button_height = 50 * get_scale_factor()
-        button_spacing = 70 * get_scale_factor()
+        sf = get_scale_factor()
+        button_width = 200 * sf
+        button_height = 50 * sf
+        button_spacing = 70 * sf
         start_y = CURRENT_HEIGHT//2
-        
+        back_x = 50 * sf
+        back_y = CURRENT_HEIGHT - 80 * sf
+
         # Calculate center position - ensure buttons are always centered
         center_x = (CURRENT_WIDTH - button_width) // 2
-        
+
+        if not settings['buttons']:
+            # One-time creation: labels and ids are static, geometry is
+            # filled in by the repositioning pass below
+            settings['buttons']['opening'] = [
+                create_button(text, 0, 0, 0, 0, button_font, button_id)
+                for text, button_id in [("Start Game", "start"),
+                                        ("How to Play", "howto"),
+                                        ("About", "about"),
+                                        ("Settings", "settings"),
+                                        ("Quit", "quit")]
+            ]
+            settings['buttons']['how_to_play'] = [
+                create_button("Back", 0, 0, 0, 0, button_font, "back_howto")
+            ]
+            settings['buttons']['about'] = [
+                create_button("Back", 0, 0, 0, 0, button_font, "back_about")
+            ]
+            settings['buttons']['settings'] = [
+                create_button("Back", 0, 0, 0, 0, button_font, "back_settings"),
+                create_button("-", 0, 0, 0, 0, button_font, "radius_minus"),
+                create_button("+", 0, 0, 0, 0, button_font, "radius_plus"),
+                create_button("-", 0, 0, 0, 0, button_font, "depth_minus"),
+                create_button("+", 0, 0, 0, 0, button_font, "depth_plus")
+            ]
+
         # Opening screen buttons
-        settings['buttons']['opening'] = [
-            create_button("Start Game", center_x, start_y, button_width, button_height, button_font, "start"),
-            create_button("How to Play", center_x, start_y + button_spacing, button_width, button_height, button_font, "howto"),
-            create_button("About", center_x, start_y + 2*button_spacing, button_width, button_height, button_font, "about"),
-            create_button("Settings", center_x, start_y + 3*button_spacing, button_width, button_height, button_font, "settings"),
-            create_button("Quit", center_x, start_y + 4*button_spacing, button_width, button_height, button_font, "quit")
-        ]
-        
-        # How to Play screen buttons
-        settings['buttons']['how_to_play'] = [
-            create_button("Back", 50 * get_scale_factor(), CURRENT_HEIGHT - 80 * get_scale_factor(), 
-                          button_width, button_height, button_font, "back_howto")
-        ]
-        
-        # About screen buttons
-        settings['buttons']['about'] = [
-            create_button("Back", 50 * get_scale_factor(), CURRENT_HEIGHT - 80 * get_scale_factor(), 
-                          button_width, button_height, button_font, "back_about")
-        ]
-        
+        for idx, button in enumerate(settings['buttons']['opening']):
+            button['rect'].update(center_x, start_y + idx * button_spacing,
+                                  button_width, button_height)
+
+        # Back buttons on the sub-screens
+        settings['buttons']['how_to_play'][0]['rect'].update(
+            back_x, back_y, button_width, button_height)
+        settings['buttons']['about'][0]['rect'].update(
+            back_x, back_y, button_width, button_height)
+
         # Settings screen buttons
-        settings['buttons']['settings'] = [
-            create_button("Back", 50 * get_scale_factor(), CURRENT_HEIGHT - 80 * get_scale_factor(), 
-                          button_width, button_height, button_font, "back_settings"),
-            create_button("-", CURRENT_WIDTH//2 + 50 * get_scale_factor(), 150 * get_scale_factor(), 
-                          50 * get_scale_factor(), button_height, button_font, "radius_minus"),
-            create_button("+", CURRENT_WIDTH//2 + 110 * get_scale_factor(), 150 * get_scale_factor(), 
-                          50 * get_scale_factor(), button_height, button_font, "radius_plus"),
-            create_button("-", CURRENT_WIDTH//2 + 50 * get_scale_factor(), 190 * get_scale_factor(), 
-                          50 * get_scale_factor(), button_height, button_font, "depth_minus"),
-            create_button("+", CURRENT_WIDTH//2 + 110 * get_scale_factor(), 190 * get_scale_factor(), 
-                          50 * get_scale_factor(), button_height, button_font, "depth_plus")
-        ]
+        settings_buttons = settings['buttons']['settings']
+        settings_buttons[0]['rect'].update(back_x, back_y, button_width, button_height)
+        settings_buttons[1]['rect'].update(CURRENT_WIDTH//2 + 50 * sf, 150 * sf,
+                                           50 * sf, button_height)
+        settings_buttons[2]['rect'].update(CURRENT_WIDTH//2 + 110 * sf, 150 * sf,
+                                           50 * sf, button_height)
+        settings_buttons[3]['rect'].update(CURRENT_WIDTH//2 + 50 * sf, 190 * sf,
+                                           50 * sf, button_height)
+        settings_buttons[4]['rect'].update(CURRENT_WIDTH//2 + 110 * sf, 190 * sf,
+                                           50 * sf, button_height)
+
+        # Keep label rects centered on their buttons
+        for buttons in settings['buttons'].values():
+            for button in buttons:
+                button['text_rect'].center = button['rect'].center
     update_buttons()
     
     # Initialize hexagons (adjust count as needed)
@@ -1627,13 +2012,23 @@ def main():
     UI_ANIMATION['current_screen'] = current_state
     clock = pygame.time.Clock()
     running = True
-    
+    last_input_time = pygame.time.get_ticks()
+    last_mouse_pos = pygame.mouse.get_pos()
+
     while running:
         # Update hexagons for animation
         update_hexagons()
-        
+
+        # MOUSEMOTION is blocked, so poll the cursor: moving the mouse
+        # counts as input and restores the full frame rate below
+        mouse_pos = pygame.mouse.get_pos()
+        if mouse_pos != last_mouse_pos:
+            last_mouse_pos = mouse_pos
+            last_input_time = pygame.time.get_ticks()
+
         # Handle window resize event outside of state-specific handlers
         for event in pygame.event.get():
+            last_input_time = pygame.time.get_ticks()
             if event.type == pygame.QUIT:
                 running = False
                 break
@@ -1641,9 +2036,13 @@ def main():
                 # Update current window size
                 CURRENT_WIDTH, CURRENT_HEIGHT = event.size
                 screen = pygame.display.set_mode((CURRENT_WIDTH, CURRENT_HEIGHT), pygame.RESIZABLE)
+                _update_scale_factor()
+                # Cached gradients and text are sized to the old window
+                _GRADIENT_CACHE.clear()
+                _TEXT_CACHE.clear()
                 # Recalculate font size based on new window size
-                base_font = pygame.font.SysFont(None, int(28 * get_scale_factor()))
-                button_font = pygame.font.SysFont(None, int(32 * get_scale_factor()))
+                base_font = get_font(int(28 * get_scale_factor()))
+                button_font = get_font(int(32 * get_scale_factor()))
                 update_buttons()
                 # Reinitialize hexagons for the new screen size
                 UI_ANIMATION['hexagons'] = initialize_hexagons(25, CURRENT_WIDTH, CURRENT_HEIGHT)
@@ -1667,25 +2066,14 @@ def main():
         # Draw the current screen
         if current_state == 'TRANSITION':
             # Draw the current screen as base
-            if UI_ANIMATION['current_screen'] == 'OPENING_SCREEN':
-                draw_opening_screen(screen, base_font, button_font, settings)
-            elif UI_ANIMATION['current_screen'] == 'HOW_TO_PLAY_SCREEN':
-                draw_how_to_play_screen(screen, base_font, settings)
-            elif UI_ANIMATION['current_screen'] == 'ABOUT_SCREEN':
-                draw_about_screen(screen, base_font, settings)
-            elif UI_ANIMATION['current_screen'] == 'SETTINGS_SCREEN':
-                draw_settings_screen(screen, base_font, settings)
-                
+            drawer = SCREEN_DRAWERS.get(UI_ANIMATION['current_screen'])
+            if drawer:
+                drawer(screen, settings, False)
+
             # Draw transition effect on top
             draw_transition(screen, None, settings)
-        elif current_state == 'OPENING_SCREEN':
-            draw_opening_screen(screen, base_font, button_font, settings)
-        elif current_state == 'HOW_TO_PLAY_SCREEN':
-            draw_how_to_play_screen(screen, base_font, settings)
-        elif current_state == 'ABOUT_SCREEN':
-            draw_about_screen(screen, base_font, settings)
-        elif current_state == 'SETTINGS_SCREEN':
-            draw_settings_screen(screen, base_font, settings)
+        elif current_state in SCREEN_DRAWERS:
+            SCREEN_DRAWERS[current_state](screen, settings, False)
         elif current_state == 'GAME_RUNNING':
             pygame.display.set_caption("HexaHunt - Playing Game")
             run_game_loop(screen, base_font, settings)
@@ -1695,7 +2083,11 @@ def main():
         elif current_state == 'QUIT':
             running = False
         
-        clock.tick(60)  # Increase to 60 FPS for smoother animations
+        # 60 FPS for smooth animations; drop to half rate once the menus
+        # have been idle for a while to save CPU (input restores 60)
+        idle = (not UI_ANIMATION['transition_active']
+                and pygame.time.get_ticks() - last_input_time > 5000)
+        clock.tick(30 if idle else 60)
     
     pygame.quit()
     sys.exit()